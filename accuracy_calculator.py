@@ -1,3 +1,7 @@
+import functools
+
+import numpy as np
+from scipy.special import bdtrc, betaln, gammaln, xlog1py, xlogy
 from scipy.stats import binom
 
 
@@ -10,6 +14,7 @@ class Agent:
         source_evaluative_capacity: float = 0.5,
         content_evaluative_capacity: float = 0.5,
         trustee_accuracy: float = None,
+        correlation: float = 0,
     ):
         self.degree_open_mindedness = degree_open_mindedness
         self.competence_unreliable_group = competence_unreliable_group
@@ -18,6 +23,7 @@ class Agent:
         self.content_evaluative_capacity = content_evaluative_capacity
         self.accuracy_close_mind = self.competence_reliable_group
         self.trustee_accuracy = trustee_accuracy
+        self.correlation = correlation
 
         if self.trustee_accuracy is None:
             self.trustee_accuracy = (
@@ -43,13 +49,13 @@ class Agent:
     def probability_right_even_degree(self) -> float:
         # I win in two events:
         # (a) exactly half of the neighbors are correct and I am correct
-        p_me_correct_causing_win = self.competence_reliable_group * binom.pmf(
+        p_me_correct_causing_win = self.competence_reliable_group * self.neighbors_pmf(
             self.degree_open_mindedness / 2,
             self.degree_open_mindedness,
             self.accuracy_information(),
         )
         # (b) more than half of the neighbors are correct
-        p_win_without_me = binom.sf(
+        p_win_without_me = self.neighbors_sf(
             self.degree_open_mindedness / 2,
             self.degree_open_mindedness,
             self.accuracy_information(),
@@ -59,14 +65,14 @@ class Agent:
     def probability_right_uneven_degree(self) -> float:
         # I win in three events:
         # (a) exactly half of the neighbors plus 1 are correct and I am correct
-        p_me_causing_win = self.competence_reliable_group * binom.pmf(
+        p_me_causing_win = self.competence_reliable_group * self.neighbors_pmf(
             (self.degree_open_mindedness + 1) / 2,
             self.degree_open_mindedness,
             self.accuracy_information(),
         )
 
         # (b) more than half of the neighbors plus 1 are correct
-        p_win_without_me = binom.sf(
+        p_win_without_me = self.neighbors_sf(
             (self.degree_open_mindedness + 1) / 2,
             self.degree_open_mindedness,
             self.accuracy_information(),
@@ -81,7 +87,7 @@ class Agent:
         # A tie occurs in two events:
         # (a) exactly half of the neighbors minus 1 are correct and I am correct
         p_me_correct_causing_tie = (
-            binom.pmf(
+            self.neighbors_pmf(
                 (self.degree_open_mindedness - 1) / 2,
                 self.degree_open_mindedness,
                 self.accuracy_information(),
@@ -90,14 +96,30 @@ class Agent:
         )
 
         # (b) exactly half of the neighbors plus 1 are correct and I am incorrect
-        p_me_wrong_causing_tie = (1 - self.competence_reliable_group) * binom.pmf(
-            (self.degree_open_mindedness + 1) / 2,
-            self.degree_open_mindedness,
-            self.accuracy_information(),
+        p_me_wrong_causing_tie = (1 - self.competence_reliable_group) * (
+            self.neighbors_pmf(
+                (self.degree_open_mindedness + 1) / 2,
+                self.degree_open_mindedness,
+                self.accuracy_information(),
+            )
         )
 
         return p_me_correct_causing_tie + p_me_wrong_causing_tie
 
+    def neighbors_pmf(self, k, n, p) -> float:
+        # Probability that exactly k of the n neighbors are correct. The opinions of
+        # the neighbors are independent, unless they are correlated, in which case
+        # the number of correct neighbors is beta-binomial
+        if self.correlation == 0:
+            return binom.pmf(k, n, p)
+        return float(beta_binomial_pmf(k, n, p, self.correlation))
+
+    def neighbors_sf(self, k, n, p) -> float:
+        # Probability that more than k of the n neighbors are correct
+        if self.correlation == 0:
+            return binom.sf(k, n, p)
+        return float(beta_binomial_sf(k, n, p, self.correlation))
+
     def accuracy_information(self) -> float:
         probability_right_and_accept = (
             self.trustee_accuracy
@@ -109,3 +131,282 @@ class Agent:
         probability_accept = probability_right_and_accept + probability_wrong_and_accept
         information_accuracy = probability_right_and_accept / probability_accept
         return information_accuracy
+
+
+def binomial_pmf(k, n, p) -> np.ndarray:
+    """Binomial probability mass function, broadcast over all arguments. Computed
+    in log-space directly with ufuncs, which is several times faster on large grids
+    than `scipy.stats.binom.pmf` and stays finite for large n."""
+    return np.exp(
+        gammaln(n + 1)
+        - gammaln(k + 1)
+        - gammaln(n - k + 1)
+        + xlogy(k, p)
+        + xlog1py(n - k, -p)
+    )
+
+
+def binomial_sf(k, n, p) -> np.ndarray:
+    """Binomial survival function P(X > k), broadcast over all arguments."""
+    return bdtrc(k, np.asarray(n).astype(int), p)
+
+
+def beta_mixing_parameters(p, correlation) -> tuple:
+    """Returns the parameters (alpha, beta) of the Beta distribution of the success
+    probability of a beta-binomial with mean p and intra-class correlation
+    `correlation`, together with the masks of the cells where the trials are
+    correlated and where the distribution is degenerate (all trials agree). Outside
+    of the correlated cells, alpha and beta are set to the harmless value 1."""
+    is_degenerate = (correlation >= 1) | (p <= 0) | (p >= 1)
+    is_correlated = (correlation > 0) & ~is_degenerate
+    concentration = np.where(
+        is_correlated, (1 - correlation) / np.where(is_correlated, correlation, 1), 2
+    )
+    alpha = np.where(is_correlated, p, 0.5) * concentration
+    beta = np.where(is_correlated, 1 - p, 0.5) * concentration
+    return alpha, beta, is_correlated, is_degenerate
+
+
+def beta_binomial_log_pmf(k, n, alpha, beta) -> np.ndarray:
+    """Logarithm of the beta-binomial probability mass function with parameters
+    (alpha, beta) of its Beta distribution, for 0 <= k <= n."""
+    return (
+        gammaln(n + 1)
+        - gammaln(k + 1)
+        - gammaln(n - k + 1)
+        + betaln(k + alpha, n - k + beta)
+        - betaln(alpha, beta)
+    )
+
+
+def beta_binomial_pmf(k, n, p, correlation) -> np.ndarray:
+    """Beta-binomial probability mass function with mean p per trial and
+    intra-class correlation `correlation` between the trials, broadcast over all
+    arguments. It is exactly the binomial pmf where the correlation is 0 and puts all
+    mass on 0 and n where the correlation is 1 (or p is 0 or 1)."""
+    k, n, p, correlation = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (k, n, p, correlation))
+    )
+    alpha, beta, is_correlated, is_degenerate = beta_mixing_parameters(p, correlation)
+    is_possible = (k >= 0) & (k <= n)
+    log_pmf = beta_binomial_log_pmf(np.where(is_possible, k, 0), n, alpha, beta)
+    two_point_pmf = np.where(k == n, p, 0) + np.where(k == 0, 1 - p, 0)
+    pmf = np.where(
+        is_degenerate,
+        two_point_pmf,
+        np.where(is_correlated, np.exp(log_pmf), binomial_pmf(k, n, p)),
+    )
+    return np.where(is_possible, pmf, 0)
+
+
+def beta_binomial_tail(k, n, alpha, beta, block_size: int = 64) -> np.ndarray:
+    """Beta-binomial survival function P(X > k) with parameters (alpha, beta) of its
+    Beta distribution, for 1-d arrays of cells.
+
+    The terms of the tail are summed outward from its largest term: the term nearest
+    to the mean where the pmf is log-concave (alpha, beta >= 1) and an end of the
+    tail otherwise (the pmf is then monotone or U-shaped). Only that term is computed
+    in log-space; the others follow, relative to it, from the ratios of consecutive
+    terms, in blocks of `block_size` terms for all cells at once. The terms hardly
+    exceed the first one, so that none overflows and the small ones that underflow
+    are negligible. In log-concave cells the ratios keep decreasing away from the
+    mode, so that the sum stops once the rest of the tail is below the precision."""
+    first = np.maximum(np.floor(k) + 1, 0)
+    is_empty = first > n
+    first = np.minimum(first, n)
+    is_log_concave = (alpha >= 1) & (beta >= 1)
+    start = np.where(
+        is_log_concave,
+        np.clip(np.round(n * alpha / (alpha + beta)), first, n),
+        np.where(
+            beta_binomial_log_pmf(first, n, alpha, beta)
+            >= beta_binomial_log_pmf(n, n, alpha, beta),
+            first,
+            n,
+        ),
+    )
+    total = np.ones_like(start)
+    offsets = np.arange(1, block_size + 1)
+    for direction in (1, -1):
+        position = start.copy()
+        term = np.ones_like(start)
+        # One past the end of the tail in this direction
+        stop = n + 1 if direction == 1 else first - 1
+        active = np.flatnonzero(~is_empty & (start != stop - direction))
+        while active.size:
+            cell_n = n[active, None]
+            cell_alpha = alpha[active, None]
+            cell_beta = beta[active, None]
+            # The numbers of correct neighbors are clamped to one past the end of
+            # the tail, where the ratio is 0, so that the terms past it vanish
+            if direction == 1:
+                number_correct = np.minimum(
+                    position[active, None] + offsets, cell_n + 1
+                )
+                # pmf(j) / pmf(j - 1)
+                ratio = (
+                    (cell_n + 1 - number_correct)
+                    * (number_correct + cell_alpha - 1)
+                    / (
+                        number_correct
+                        * np.maximum(cell_n + cell_beta - number_correct, cell_beta)
+                    )
+                )
+            else:
+                cell_first = first[active, None]
+                number_correct = np.maximum(
+                    position[active, None] - offsets, cell_first - 1
+                )
+                # pmf(j) / pmf(j + 1)
+                ratio = (
+                    (number_correct >= cell_first)
+                    * (number_correct + 1)
+                    * (cell_n + cell_beta - 1 - number_correct)
+                    / (
+                        (cell_n - number_correct)
+                        * np.maximum(number_correct + cell_alpha, cell_alpha)
+                    )
+                )
+            terms = np.cumprod(ratio, axis=1)
+            terms *= term[active, None]
+            total[active] += terms.sum(axis=1)
+            term[active] = terms[:, -1]
+            position[active] = number_correct[:, -1]
+            last_ratio = ratio[:, -1]
+            # The rest of the tail is at most term * r / (1 - r) in log-concave cells
+            is_negligible = (
+                is_log_concave[active]
+                & (last_ratio < 1)
+                & (
+                    term[active] * last_ratio
+                    < np.finfo(float).eps * (1 - last_ratio) * total[active]
+                )
+            )
+            active = active[(position[active] != stop[active]) & ~is_negligible]
+    return np.where(
+        is_empty,
+        0,
+        np.minimum(
+            np.exp(beta_binomial_log_pmf(start, n, alpha, beta) + np.log(total)), 1
+        ),
+    )
+
+
+def beta_binomial_sf(k, n, p, correlation, chunk_size: int = 512) -> np.ndarray:
+    """Beta-binomial survival function P(X > k) for integer k, broadcast over all
+    arguments; see `beta_binomial_pmf`. The tail of the correlated cells is summed by
+    `beta_binomial_tail`, `chunk_size` cells at a time so that its blocks of terms
+    stay in cache; it stays fast and stable for large n."""
+    k, n, p, correlation = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (k, n, p, correlation))
+    )
+    if not np.any(correlation > 0):
+        return binomial_sf(k, n, p)
+    alpha, beta, is_correlated, is_degenerate = beta_mixing_parameters(p, correlation)
+    sf = np.array(np.broadcast_to(binomial_sf(k, n, p), k.shape), dtype=float)
+    cells = np.flatnonzero(is_correlated)
+    for start in range(0, cells.size, chunk_size):
+        chunk = cells[start : start + chunk_size]
+        sf.flat[chunk] = beta_binomial_tail(
+            k.flat[chunk], n.flat[chunk], alpha.flat[chunk], beta.flat[chunk]
+        )
+    two_point_sf = np.where(n > k, p, 0) + np.where(0 > k, 1 - p, 0)
+    return np.where(is_degenerate, two_point_sf, sf)
+
+
+def trustee_accuracy_array(
+    competence_unreliable_group, competence_reliable_group, source_evaluative_capacity
+) -> np.ndarray:
+    """Vectorized counterpart of the trustee accuracy computed in `Agent.__init__`.
+    All arguments are broadcast against each other."""
+    source_evaluative_capacity = np.asarray(source_evaluative_capacity, dtype=float)
+    return source_evaluative_capacity * np.asarray(competence_reliable_group) + (
+        1 - source_evaluative_capacity
+    ) * (1 - np.asarray(competence_unreliable_group))
+
+
+def accuracy_information_array(
+    trustee_accuracy, content_evaluative_capacity
+) -> np.ndarray:
+    """Vectorized counterpart of `Agent.accuracy_information`."""
+    trustee_accuracy = np.asarray(trustee_accuracy, dtype=float)
+    content_evaluative_capacity = np.asarray(content_evaluative_capacity, dtype=float)
+    probability_right_and_accept = trustee_accuracy * content_evaluative_capacity
+    probability_wrong_and_accept = (1 - trustee_accuracy) * (
+        1 - content_evaluative_capacity
+    )
+    return probability_right_and_accept / (
+        probability_right_and_accept + probability_wrong_and_accept
+    )
+
+
+def accuracy_open_mind_array(
+    degree_open_mindedness=10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    correlation=0,
+) -> np.ndarray:
+    """Vectorized counterpart of `Agent.accuracy_open_mind`.
+
+    All parameters may be scalars or arrays and are broadcast against each other,
+    so that a whole parameter grid is evaluated with a handful of array operations
+    instead of one `Agent` per cell.
+
+    Returns
+    -------
+    accuracy: np.ndarray
+        Accuracy of the open-minded agent for every (broadcast) parameter setting
+    """
+    n = np.asarray(degree_open_mindedness)
+    competence_reliable_group = np.asarray(competence_reliable_group, dtype=float)
+    information_accuracy = accuracy_information_array(
+        trustee_accuracy_array(
+            competence_unreliable_group,
+            competence_reliable_group,
+            source_evaluative_capacity,
+        ),
+        content_evaluative_capacity,
+    )
+    # Even degrees (including the close-minded n = 0): I win if more than half of the
+    # neighbors are correct, or exactly half are and I am correct.
+    # Uneven degrees: I win if more than (n + 1) / 2 of the neighbors are correct,
+    # or exactly (n + 1) / 2 are and I am correct, or there is a tie and the random
+    # choice is correct.
+    if np.any(np.asarray(correlation) != 0):
+        neighbors_pmf = functools.partial(beta_binomial_pmf, correlation=correlation)
+        neighbors_sf = functools.partial(beta_binomial_sf, correlation=correlation)
+    else:
+        neighbors_pmf, neighbors_sf = binomial_pmf, binomial_sf
+    is_even = (n % 2) == 0
+    threshold = np.where(is_even, n // 2, (n + 1) // 2)
+    pmf_threshold = neighbors_pmf(threshold, n, information_accuracy)
+    p_win = competence_reliable_group * pmf_threshold + neighbors_sf(
+        threshold, n, information_accuracy
+    )
+    p_tie = (
+        competence_reliable_group * neighbors_pmf((n - 1) // 2, n, information_accuracy)
+        + (1 - competence_reliable_group) * pmf_threshold
+    )
+    return np.where(is_even, p_win, p_win + 0.5 * p_tie)
+
+
+def benefit_open_mind_array(
+    degree_open_mindedness=10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    correlation=0,
+) -> np.ndarray:
+    """Vectorized counterpart of `Agent.benefit_open_mind`; see
+    `accuracy_open_mind_array`."""
+    return accuracy_open_mind_array(
+        degree_open_mindedness,
+        competence_unreliable_group,
+        competence_reliable_group,
+        source_evaluative_capacity,
+        content_evaluative_capacity,
+        correlation,
+    ) - np.asarray(competence_reliable_group, dtype=float)
@@ -0,0 +1,147 @@
+import functools
+
+import numpy as np
+
+from accuracy_calculator import (
+    accuracy_information_array,
+    beta_binomial_pmf,
+    binomial_pmf,
+    trustee_accuracy_array,
+)
+
+UNDECIDED_OUTCOMES = ("coin", "abstain", "own")
+
+
+class AggregationRule:
+    def __init__(
+        self, threshold: float = 0.5, self_weight: float = 1, undecided: str = "coin"
+    ):
+        """Rule by which an agent aggregates its own opinion and the opinions of its
+        neighbors.
+
+        The agent's own opinion counts with weight `self_weight` and every neighbor
+        with weight 1. An option is adopted when its share of the total weight is
+        strictly larger than `threshold`. When neither option is adopted, the agent
+        flips a coin ('coin'), abstains ('abstain', which is never correct) or keeps
+        its own opinion ('own').
+
+        The default rule is the simple majority with a coin flip on ties of `Agent`;
+        a threshold above 0.5 gives a supermajority rule."""
+        if threshold < 0.5:
+            raise ValueError("The threshold must be at least one half")
+        if undecided not in UNDECIDED_OUTCOMES:
+            raise ValueError(f"Undecided outcome must be one of {UNDECIDED_OUTCOMES}")
+        self.threshold = threshold
+        self.self_weight = self_weight
+        self.undecided = undecided
+
+    def __repr__(self):
+        return (
+            f"AggregationRule(threshold={self.threshold}, "
+            f"self_weight={self.self_weight}, undecided={self.undecided!r})"
+        )
+
+    def count_thresholds(self, degree_open_mindedness: int) -> dict:
+        """Returns, for each of my own opinions (correct or wrong), the smallest
+        number of correct neighbors for which the correct option is adopted and the
+        largest number for which the wrong option is adopted."""
+        n = degree_open_mindedness
+        # Rounding guards the strict inequalities against floating point noise
+        required_weight = np.round(self.threshold * (n + self.self_weight), 9)
+        return {
+            True: (
+                int(np.floor(required_weight - self.self_weight)) + 1,
+                int(np.ceil(n - required_weight)) - 1,
+            ),
+            False: (
+                int(np.floor(required_weight)) + 1,
+                int(np.ceil(n + self.self_weight - required_weight)) - 1,
+            ),
+        }
+
+
+def accuracy_rules_array(
+    rules: list,
+    degree_open_mindedness: int = 10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    correlation=0,
+) -> list:
+    """Computes the accuracy of an open-minded agent under each of the aggregation
+    rules.
+
+    The distribution of the number of correct neighbors does not depend on the rule,
+    so its cumulative distribution function is computed once for the whole grid. Each
+    rule then only looks up the cumulative probabilities at its own thresholds, so
+    that evaluating many rules costs about the same as evaluating one.
+
+    Parameters
+    ----------
+    rules: list
+        List of `AggregationRule`
+    degree_open_mindedness: int
+        Degree of open-mindedness
+    other parameters:
+        Parameters of `Agent`, scalars or arrays that are broadcast against each
+        other
+
+    Returns
+    -------
+    accuracies: list
+        Accuracy of the open-minded agent for every (broadcast) parameter setting,
+        one array per rule"""
+    # 0. Initialize variables
+    n = int(degree_open_mindedness)
+    competence_reliable_group = np.asarray(competence_reliable_group, dtype=float)
+    information_accuracy = accuracy_information_array(
+        trustee_accuracy_array(
+            competence_unreliable_group,
+            competence_reliable_group,
+            source_evaluative_capacity,
+        ),
+        content_evaluative_capacity,
+    )
+    correlation = np.asarray(correlation, dtype=float)
+    if np.any(correlation != 0):
+        neighbors_pmf = functools.partial(
+            beta_binomial_pmf, correlation=correlation[..., None]
+        )
+    else:
+        neighbors_pmf = binomial_pmf
+
+    # 1. Cumulative probabilities of the number of correct neighbors, from below
+    # and from above (so that both tails are accurate), padded such that any count
+    # can be looked up
+    pmf = neighbors_pmf(np.arange(n + 1), n, information_accuracy[..., None])
+    padding = np.zeros(pmf.shape[:-1] + (1,))
+    cdf = np.concatenate([padding, np.cumsum(pmf, axis=-1)], axis=-1)
+    sf = np.concatenate([np.cumsum(pmf[..., ::-1], axis=-1)[..., ::-1], padding], -1)
+
+    def p_at_most(count):
+        # P(X <= count)
+        return cdf[..., min(max(count, -1), n) + 1]
+
+    def p_at_least(count):
+        # P(X >= count)
+        return sf[..., min(max(count, 0), n + 1)]
+
+    # 2. Evaluate every rule by looking up its thresholds
+    accuracies = []
+    for rule in rules:
+        accuracy = 0
+        for me_correct, p_me in [
+            (True, competence_reliable_group),
+            (False, 1 - competence_reliable_group),
+        ]:
+            least_correct, most_wrong = rule.count_thresholds(n)[me_correct]
+            p_correct = p_at_least(least_correct)
+            p_undecided = np.clip(1 - p_correct - p_at_most(most_wrong), 0, 1)
+            if rule.undecided == "coin":
+                p_correct = p_correct + 0.5 * p_undecided
+            elif rule.undecided == "own" and me_correct:
+                p_correct = p_correct + p_undecided
+            accuracy = accuracy + p_me * p_correct
+        accuracies.append(accuracy)
+    return accuracies
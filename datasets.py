@@ -0,0 +1,220 @@
+import json
+import os
+import struct
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+ARROW_EXTENSIONS = (".arrow", ".feather")
+PARQUET_EXTENSIONS = (".parquet",)
+METADATA_KEY = b"open_mind"
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Parquet and Arrow files require pyarrow (pip install pyarrow); "
+            "use a .npz file otherwise"
+        ) from error
+    return pyarrow
+
+
+def save_dataset(
+    filename: str,
+    values,
+    axes: dict,
+    quantity: str = "benefit",
+    fixed_parameters: dict = None,
+) -> str:
+    """Writes computed values on a grid, with the values of its axes and the fixed
+    parameters, such that analyses can load them without re-running the model.
+
+    The format follows the extension of `filename`: '.npz' (uncompressed, the
+    default), '.parquet', or '.arrow'/'.feather' (Arrow IPC); the latter two require
+    pyarrow. Arrays are written straight from their buffers, without copying them
+    as a whole. Parquet and Arrow files hold a long table with one column per axis and
+    one column of values, as expected by dataframe tools.
+
+    Parameters
+    ----------
+    filename: str
+        Location of the file
+    values: np.ndarray
+        Values on the grid, with one dimension per axis
+    axes: dict
+        Maps the name of every axis to its values, in the order of the dimensions
+    quantity: str
+        Name of the computed quantity
+    fixed_parameters: dict
+        Values of the parameters that are the same for the whole grid
+
+    Returns
+    -------
+    filename: str
+        Location of the file"""
+    values = np.asarray(values)
+    axes = {name: np.asarray(axis_values) for name, axis_values in axes.items()}
+    if values.shape != tuple(axis_values.size for axis_values in axes.values()):
+        raise ValueError(
+            f"Shape {values.shape} of the values does not match the axes "
+            f"{ {name: axis_values.size for name, axis_values in axes.items()} }"
+        )
+    metadata = {
+        "quantity": quantity,
+        "axes": list(axes),
+        "shape": list(values.shape),
+        "fixed_parameters": fixed_parameters or {},
+    }
+    extension = os.path.splitext(filename)[1]
+    if extension in ARROW_EXTENSIONS + PARQUET_EXTENSIONS:
+        pyarrow = import_pyarrow()
+        metadata["axis_values"] = {
+            name: axis_values.tolist() for name, axis_values in axes.items()
+        }
+        grid = np.meshgrid(*axes.values(), indexing="ij", sparse=True)
+        table = pyarrow.table(
+            {
+                **{
+                    name: np.broadcast_to(axis_grid, values.shape).ravel()
+                    for name, axis_grid in zip(axes, grid)
+                },
+                # A view of the values for contiguous grids
+                quantity: values.ravel(),
+            }
+        ).replace_schema_metadata(
+            {METADATA_KEY: json.dumps(metadata, default=lambda value: value.item())}
+        )
+        if extension in PARQUET_EXTENSIONS:
+            import pyarrow.parquet
+
+            pyarrow.parquet.write_table(table, filename)
+        else:
+            import pyarrow.feather
+
+            pyarrow.feather.write_feather(table, filename, compression="uncompressed")
+    else:
+        if extension != ".npz":
+            filename = f"{filename}.npz"
+        # np.savez does not compress, so that the arrays can be memory-mapped
+        np.savez(
+            filename,
+            metadata=json.dumps(metadata, default=lambda value: value.item()),
+            values=values,
+            **{f"axis_{name}": axis_values for name, axis_values in axes.items()},
+        )
+    return filename
+
+
+def memory_map_npz(filename: str) -> dict:
+    """Returns the arrays of an uncompressed .npz file, memory-mapped read-only at
+    their offsets within the file rather than read into memory."""
+    arrays = {}
+    with zipfile.ZipFile(filename) as archive, open(filename, "rb") as file:
+        for member in archive.infolist():
+            if member.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{filename} is compressed and cannot be mapped")
+            # The data follow the local header, whose length depends on the lengths
+            # of the name and extra field it holds
+            file.seek(member.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", file.read(4))
+            file.seek(name_length + extra_length, os.SEEK_CUR)
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                read_array_header = np.lib.format.read_array_header_1_0
+            else:
+                read_array_header = np.lib.format.read_array_header_2_0
+            shape, fortran_order, dtype = read_array_header(file)
+            name = member.filename[: -len(".npy")]
+            if dtype.hasobject or not shape:
+                # Small arrays such as the metadata are simply read
+                with archive.open(member) as member_file:
+                    arrays[name] = np.load(member_file)
+            else:
+                arrays[name] = np.memmap(
+                    filename,
+                    dtype=dtype,
+                    mode="r",
+                    offset=file.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+    return arrays
+
+
+def load_dataset(filename: str) -> tuple:
+    """Loads a dataset written by `save_dataset`. The values are memory-mapped, so
+    that loading is immediate and only the parts that are used are read from disk.
+
+    Returns
+    -------
+    (values, axes, metadata): tuple
+        Values on the grid, the values of every axis in the order of the dimensions,
+        and the metadata (quantity, names of the axes, fixed parameters)"""
+    extension = os.path.splitext(filename)[1]
+    if extension in ARROW_EXTENSIONS + PARQUET_EXTENSIONS:
+        pyarrow = import_pyarrow()
+        if extension in PARQUET_EXTENSIONS:
+            import pyarrow.parquet
+
+            table = pyarrow.parquet.read_table(filename, memory_map=True)
+        else:
+            import pyarrow.feather
+
+            table = pyarrow.feather.read_table(filename, memory_map=True)
+        metadata = json.loads(table.schema.metadata[METADATA_KEY])
+        axes = {
+            name: np.asarray(metadata["axis_values"].pop(name))
+            for name in metadata["axes"]
+        }
+        del metadata["axis_values"]
+        values = (
+            table.column(metadata["quantity"])
+            .combine_chunks()
+            .to_numpy(zero_copy_only=False)
+            .reshape(metadata["shape"])
+        )
+        return values, axes, metadata
+    arrays = memory_map_npz(filename)
+    metadata = json.loads(str(arrays["metadata"]))
+    axes = {name: np.asarray(arrays[f"axis_{name}"]) for name in metadata["axes"]}
+    return arrays["values"], axes, metadata
+
+
+def save_dataframe(
+    filename: str,
+    dataframe: pd.DataFrame,
+    index_name: str,
+    columns_name: str,
+    quantity: str = "benefit",
+    fixed_parameters: dict = None,
+) -> str:
+    """Writes the data of a figure, a dataframe whose index and columns are the
+    values of two parameters, with `save_dataset`."""
+    return save_dataset(
+        filename,
+        dataframe.to_numpy(dtype=float),
+        {
+            index_name: dataframe.index.to_numpy(),
+            columns_name: dataframe.columns.to_numpy(dtype=float),
+        },
+        quantity=quantity,
+        fixed_parameters=fixed_parameters,
+    )
+
+
+def load_dataframe(filename: str) -> pd.DataFrame:
+    """Loads the data of a figure written by `save_dataframe` as a dataframe, with
+    the metadata in its `attrs`."""
+    values, axes, metadata = load_dataset(filename)
+    (index_name, index), (columns_name, columns) = axes.items()
+    dataframe = pd.DataFrame(
+        values,
+        index=pd.Index(index, name=index_name),
+        columns=pd.Index(columns, name=columns_name),
+        copy=False,
+    )
+    dataframe.attrs.update(metadata)
+    return dataframe
@@ -6,6 +6,7 @@ def find_tipping_evaluation_content(
     competence_unreliable_group: float = 0.7,
     competence_reliable_group: float = 0.6,
     source_evaluative_capacity: float = 0.5,
+    correlation: float = 0,
 ) -> float:
     """Function returns the tipping point for content evaluative capacity where
     open-mindedness becomes epistemically beneficial for an open-minded agent with
@@ -28,6 +29,7 @@ def find_tipping_evaluation_content(
         "competence_unreliable_group": competence_unreliable_group,
         "competence_reliable_group": competence_reliable_group,
         "source_evaluative_capacity": source_evaluative_capacity,
+        "correlation": correlation,
     }
 
     current_agent = Agent(content_evaluative_capacity=0.5, **agent_variables)
@@ -0,0 +1,171 @@
+import numpy as np
+from scipy.special import gammaln, logsumexp, xlogy
+
+
+def number_reliable_sources_pmf(
+    degree_open_mindedness: int,
+    size_reliable_group,
+    size_unreliable_group,
+    weight_reliable,
+    weight_unreliable,
+) -> np.ndarray:
+    """Returns the pmf of the number j of reliable sources among the
+    `degree_open_mindedness` sources that an agent draws without replacement from a
+    community with the given group sizes, when members of each group are drawn with
+    the given (relative) weights. This is Fisher's noncentral hypergeometric
+    distribution,
+
+        P(j) ~ C(R, j) C(U, n - j) w_R^j w_U^(n - j).
+
+    The binomial coefficients are computed as cumulative sums of logarithms over
+    j <= n only, so the cost does not depend on the size of the community. The
+    community must have at least n members.
+
+    Returns
+    -------
+    pmf: np.ndarray
+        Array with the broadcast shape of the arguments plus a last axis of length
+        n + 1, indexed by j"""
+    n = degree_open_mindedness
+    numbers_reliable = np.arange(n + 1)
+    size_reliable_group = np.asarray(size_reliable_group, dtype=float)[..., None]
+    size_unreliable_group = np.asarray(size_unreliable_group, dtype=float)[..., None]
+    if np.any(size_reliable_group + size_unreliable_group < n):
+        raise ValueError(
+            f"Cannot draw {n} distinct sources from a community with fewer members"
+        )
+
+    def log_falling_factorial(size):
+        # log(size (size - 1) ... (size - j + 1)) for j = 0, ..., n
+        with np.errstate(divide="ignore"):
+            log_terms = np.log(np.maximum(size - numbers_reliable[:-1], 0))
+        return np.concatenate(
+            [np.zeros(log_terms.shape[:-1] + (1,)), np.cumsum(log_terms, axis=-1)],
+            axis=-1,
+        )
+
+    log_weights = (
+        log_falling_factorial(size_reliable_group)
+        + log_falling_factorial(size_unreliable_group)[..., ::-1]
+        - gammaln(numbers_reliable + 1)
+        - gammaln(n - numbers_reliable + 1)
+        + xlogy(numbers_reliable, np.asarray(weight_reliable)[..., None])
+        + xlogy(n - numbers_reliable, np.asarray(weight_unreliable)[..., None])
+    )
+    return np.exp(log_weights - logsumexp(log_weights, axis=-1, keepdims=True))
+
+
+def accuracy_finite_community_array(
+    degree_open_mindedness: int = 10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    size_reliable_group=1000,
+    size_unreliable_group=1000,
+) -> np.ndarray:
+    """Accuracy of an open-minded agent who consults `degree_open_mindedness`
+    distinct members of a finite community with explicit group sizes.
+
+    A member of the reliable group is weighted by the source evaluative capacity and
+    a member of the unreliable group by its complement, and the content evaluation
+    further weights each group by how often its opinions are accepted. The number of
+    reliable sources is therefore noncentral hypergeometric (see
+    `number_reliable_sources_pmf`), and given that number the correct opinions are a
+    sum of two binomials. The number of correct opinions is this hypergeometric
+    mixture; its pmf is obtained from its generating function at the roots of unity
+    with one FFT. For equal group sizes that grow to infinity, the number of correct
+    opinions becomes binomial with the accuracy `Agent.accuracy_information` and the
+    result equals `Agent.accuracy_open_mind`.
+
+    The degree of open-mindedness must be an integer, at most the size of the
+    community; all other parameters may be scalars or arrays and are broadcast
+    against each other.
+
+    Returns
+    -------
+    accuracy: np.ndarray
+        Accuracy of the open-minded agent for every (broadcast) parameter setting
+    """
+    # 0. Initialize variables
+    n = int(degree_open_mindedness)
+    competence_reliable_group = np.asarray(competence_reliable_group, dtype=float)
+    source_evaluative_capacity = np.asarray(source_evaluative_capacity, dtype=float)
+    content_evaluative_capacity = np.asarray(content_evaluative_capacity, dtype=float)
+    accuracy_reliable_source = competence_reliable_group
+    accuracy_unreliable_source = 1 - np.asarray(competence_unreliable_group)
+
+    # 1. Probability that an opinion of each group is accepted, and accuracy of the
+    # accepted opinions of each group
+    def accepted(accuracy_source):
+        probability_right_and_accept = accuracy_source * content_evaluative_capacity
+        probability_accept = probability_right_and_accept + (1 - accuracy_source) * (
+            1 - content_evaluative_capacity
+        )
+        return probability_accept, probability_right_and_accept / probability_accept
+
+    accept_reliable, accuracy_reliable = accepted(accuracy_reliable_source)
+    accept_unreliable, accuracy_unreliable = accepted(accuracy_unreliable_source)
+
+    # 2. Distribution of the number of reliable sources among the accepted opinions
+    pmf_reliable_sources = number_reliable_sources_pmf(
+        n,
+        size_reliable_group,
+        size_unreliable_group,
+        source_evaluative_capacity * accept_reliable,
+        (1 - source_evaluative_capacity) * accept_unreliable,
+    )
+
+    # 3. Generating function of the number of correct opinions at the roots of
+    # unity, sum_j P(j) f_R^j f_U^(n - j), summed with a homogeneous Horner scheme.
+    # The pmf is real, so half of the roots suffice
+    roots_of_unity = np.exp(2j * np.pi * np.arange((n + 1) // 2 + 1) / (n + 1))
+    factor_reliable = 1 - accuracy_reliable[..., None] * (1 - roots_of_unity)
+    factor_unreliable = 1 - accuracy_unreliable[..., None] * (1 - roots_of_unity)
+    generating_function = pmf_reliable_sources[..., n, None] * np.ones_like(
+        factor_reliable
+    )
+    power_unreliable = np.ones_like(factor_unreliable)
+    for number_reliable in reversed(range(n)):
+        power_unreliable *= factor_unreliable
+        generating_function *= factor_reliable
+        generating_function += (
+            pmf_reliable_sources[..., number_reliable, None] * power_unreliable
+        )
+    pmf_correct = np.clip(
+        np.fft.irfft(np.conj(generating_function), n=n + 1, axis=-1), 0, 1
+    )
+
+    # 4. I adopt the majority among my own opinion and the n opinions, and flip a
+    # coin on ties
+    numbers_of_votes = np.arange(n + 2)
+    p_votes_win = np.where(
+        2 * numbers_of_votes > n + 1,
+        1.0,
+        np.where(2 * numbers_of_votes == n + 1, 0.5, 0),
+    )
+    return competence_reliable_group * (pmf_correct @ p_votes_win[1:]) + (
+        1 - competence_reliable_group
+    ) * (pmf_correct @ p_votes_win[:-1])
+
+
+def benefit_finite_community_array(
+    degree_open_mindedness: int = 10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    size_reliable_group=1000,
+    size_unreliable_group=1000,
+) -> np.ndarray:
+    """Epistemic benefit of open-mindedness in a finite community; see
+    `accuracy_finite_community_array`."""
+    return accuracy_finite_community_array(
+        degree_open_mindedness,
+        competence_unreliable_group,
+        competence_reliable_group,
+        source_evaluative_capacity,
+        content_evaluative_capacity,
+        size_reliable_group,
+        size_unreliable_group,
+    ) - np.asarray(competence_reliable_group, dtype=float)
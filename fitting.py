@@ -0,0 +1,199 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+
+from accuracy_calculator import accuracy_open_mind_array
+
+FITTED_PARAMETERS = (
+    "competence_unreliable_group",
+    "competence_reliable_group",
+    "source_evaluative_capacity",
+    "content_evaluative_capacity",
+)
+BOUNDS = (1e-6, 1 - 1e-6)
+STEP_SIZE = 1e-7
+
+
+def loss_and_gradient(
+    values: np.ndarray,
+    names: tuple,
+    fixed_parameters: dict,
+    degrees: np.ndarray,
+    observed_accuracies: np.ndarray,
+    numbers_of_trials: np.ndarray = None,
+) -> tuple:
+    """Returns the loss of the parameter values `values` (for the parameters `names`)
+    and its gradient. The loss is the negative log-likelihood of the observed numbers
+    of correct answers when `numbers_of_trials` is given, and the sum of squared
+    errors otherwise.
+
+    The loss at the values and at the finite-difference steps in every direction is
+    computed in one vectorized evaluation of the model over all observations."""
+    # 0. Evaluate the model at the values (row 0) and at one step in each direction
+    steps = np.where(values + STEP_SIZE > BOUNDS[1], -STEP_SIZE, STEP_SIZE)
+    points = np.vstack([values, values + np.diag(steps)])
+    parameters = {name: points[:, [index]] for index, name in enumerate(names)}
+    accuracies = accuracy_open_mind_array(
+        degree_open_mindedness=degrees[None, :], **parameters, **fixed_parameters
+    )
+
+    # 1. Losses of all evaluated points
+    if numbers_of_trials is None:
+        losses = ((accuracies - observed_accuracies) ** 2).sum(axis=1)
+    else:
+        accuracies = np.clip(accuracies, 1e-12, 1 - 1e-12)
+        numbers_correct = observed_accuracies * numbers_of_trials
+        losses = -(
+            numbers_correct * np.log(accuracies)
+            + (numbers_of_trials - numbers_correct) * np.log(1 - accuracies)
+        ).sum(axis=1)
+    return losses[0], (losses[1:] - losses[0]) / steps
+
+
+def minimize_loss(arguments: tuple) -> tuple:
+    """Runs the optimizer from one starting point; `arguments` holds the starting
+    values followed by the arguments of `loss_and_gradient`. Returns the tuple
+    (loss, values)."""
+    start, *loss_arguments = arguments
+    result = minimize(
+        loss_and_gradient,
+        start,
+        args=tuple(loss_arguments),
+        jac=True,
+        method="L-BFGS-B",
+        bounds=[BOUNDS] * len(start),
+    )
+    return result.fun, result.x
+
+
+def fit_accuracy(
+    degrees,
+    observed_accuracies,
+    numbers_of_trials=None,
+    fixed_parameters: dict = None,
+    number_of_starts: int = 8,
+    number_of_bootstrap_samples: int = 0,
+    confidence_level: float = 0.95,
+    processes: int = None,
+    seed: int = None,
+) -> pd.DataFrame:
+    """Estimates the parameters of `Agent` that best explain observed accuracies of
+    agents with various degrees of open-mindedness.
+
+    By maximum likelihood when the numbers of trials behind the observed accuracies
+    are given, and by least squares otherwise. The optimizer is started from
+    `number_of_starts` random points, in parallel, and the best fit is kept.
+    Confidence intervals are percentile intervals over bootstrap refits, which are
+    also run in parallel.
+
+    Accuracies across degrees of open-mindedness only depend on the parameters
+    through the competence of the reliable group and the accuracy of the accepted
+    information, so at most two parameters are identified by such data; fix the
+    others with `fixed_parameters`.
+
+    Parameters
+    ----------
+    degrees: array
+        Degree of open-mindedness of each observation
+    observed_accuracies: array
+        Observed accuracy of each observation
+    numbers_of_trials: array
+        Number of trials behind each observed accuracy (optional)
+    fixed_parameters: dict
+        Values of the parameters that are not fitted
+    number_of_starts: int
+        Number of starting points of the optimizer
+    number_of_bootstrap_samples: int
+        Number of bootstrap refits for the confidence intervals (0 for none)
+    confidence_level: float
+        Confidence level of the intervals
+    processes: int
+        Number of worker processes (1 runs everything in this process)
+    seed: int
+        Seed of the random number generator
+
+    Returns
+    -------
+    estimates: pd.DataFrame
+        Estimate of each fitted parameter, with the bounds of its confidence interval
+        when bootstrap samples are requested"""
+    # 0. Initialize variables
+    rng = np.random.default_rng(seed)
+    degrees = np.asarray(degrees)
+    observed_accuracies = np.asarray(observed_accuracies, dtype=float)
+    if numbers_of_trials is not None:
+        numbers_of_trials = np.asarray(numbers_of_trials, dtype=float)
+    fixed_parameters = fixed_parameters or {}
+    names = tuple(name for name in FITTED_PARAMETERS if name not in fixed_parameters)
+    if not names:
+        raise ValueError("There are no parameters left to fit")
+    executor = ProcessPoolExecutor(processes) if processes != 1 else None
+    mapper = executor.map if executor else map
+
+    try:
+        # 1. Multi-start fit
+        starts = rng.uniform(0.05, 0.95, (number_of_starts, len(names)))
+        fits = list(
+            mapper(
+                minimize_loss,
+                [
+                    (
+                        start,
+                        names,
+                        fixed_parameters,
+                        degrees,
+                        observed_accuracies,
+                        numbers_of_trials,
+                    )
+                    for start in starts
+                ],
+            )
+        )
+        loss, estimates = min(fits, key=lambda fit: fit[0])
+        result = pd.DataFrame({"estimate": estimates}, index=pd.Index(names))
+
+        # 2. Bootstrap refits, starting from the estimates
+        if number_of_bootstrap_samples:
+            resamples = []
+            for _ in range(number_of_bootstrap_samples):
+                if numbers_of_trials is None:
+                    # Resample the observations
+                    indices = rng.integers(0, degrees.size, degrees.size)
+                    resamples.append(
+                        (degrees[indices], observed_accuracies[indices], None)
+                    )
+                else:
+                    # Resample the trials behind every observation
+                    numbers_correct = rng.binomial(
+                        numbers_of_trials.astype(int), observed_accuracies
+                    )
+                    resamples.append(
+                        (
+                            degrees,
+                            numbers_correct / numbers_of_trials,
+                            numbers_of_trials,
+                        )
+                    )
+            bootstrap_estimates = np.array(
+                [
+                    values
+                    for _, values in mapper(
+                        minimize_loss,
+                        [
+                            (estimates, names, fixed_parameters, *resample)
+                            for resample in resamples
+                        ],
+                    )
+                ]
+            )
+            alpha = 1 - confidence_level
+            result["lower"] = np.quantile(bootstrap_estimates, alpha / 2, axis=0)
+            result["upper"] = np.quantile(bootstrap_estimates, 1 - alpha / 2, axis=0)
+    finally:
+        # Also stops the workers when a fit fails
+        if executor:
+            executor.shutdown()
+    result.attrs["loss"] = loss
+    return result
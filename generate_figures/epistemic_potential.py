@@ -3,6 +3,7 @@ import os
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from datasets import save_dataframe
 
 from generate_figures.plot_functions import cmap_line_r, lineplot_size
 
@@ -14,7 +15,7 @@ def calculate_tipping_source(competence_reliable_group, competence_unreliable_gr
     return tipping_source_evaluation
 
 
-def figure_epistemic_potential(filename: str = None):
+def figure_epistemic_potential(filename: str = None, data_filename: str = None):
     """Generates plot of required source evaluative capacities depending on the
     competences of the reliable, for one specific competence of the unreliable group,
     and coloring the areas below the curves.
@@ -23,6 +24,9 @@ def figure_epistemic_potential(filename: str = None):
         ----------
         filename: str
             Location where the plot is to be saved
+        data_filename: str
+            Location where the computed data is to be saved (.npz, or .parquet or
+            .arrow with pyarrow)
 
         Returns
         -------
@@ -32,19 +36,22 @@ def figure_epistemic_potential(filename: str = None):
     competences_unreliable_group = np.round(np.linspace(0.9, 0.55, 8), 2)
 
     # 1. Generate data for plotting
-    data = [
-        [
-            calculate_tipping_source(
-                competence_reliable_group, competence_unreliable_group
-            )
-            for competence_unreliable_group in competences_unreliable_group
-        ]
-        for competence_reliable_group in competences_reliable_group
-    ]
+    data = calculate_tipping_source(
+        competences_reliable_group[:, None], competences_unreliable_group[None, :]
+    )
     df = pd.DataFrame(
         data, index=competences_reliable_group, columns=competences_unreliable_group
     )
 
+    if data_filename:
+        save_dataframe(
+            data_filename,
+            df,
+            index_name="competence_reliable_group",
+            columns_name="competence_unreliable_group",
+            quantity="tipping_source",
+        )
+
     # 2. Plot
     ax = df.plot.area(
         stacked=False,
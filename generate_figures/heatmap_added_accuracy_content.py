@@ -3,11 +3,14 @@ import os
 import numpy as np
 import pandas as pd
 from accuracy_calculator import Agent
+from datasets import save_dataframe
 
 from generate_figures.plot_functions import plot_heatmap
 
 
-def figure_heatmap_added_accuracy_content(filename: str = None):
+def figure_heatmap_added_accuracy_content(
+    filename: str = None, data_filename: str = None
+):
     """Generates heatmap of the added accuracy when practicing not only source
     evaluation but also content evaluation for a range of competences and
     source evaluative capacities.
@@ -18,6 +21,9 @@ def figure_heatmap_added_accuracy_content(filename: str = None):
         Option to save the plot
     filename: str
         Location where the plot is to be saved
+    data_filename: str
+        Location where the computed data is to be saved (.npz, or .parquet or .arrow
+        with pyarrow)
 
     Returns
     -------
@@ -27,6 +33,10 @@ def figure_heatmap_added_accuracy_content(filename: str = None):
     trustee_accuracies = [round(0.55 + 0.05 * y, 2) for y in range(6)]
     trustee_accuracies.reverse()
     content_evaluative_capacities = [round(0.55 + 0.05 * x, 2) for x in range(6)]
+    # Unrounded values are saved; rounded values are plotted
+    data = pd.DataFrame(
+        index=trustee_accuracies, columns=content_evaluative_capacities, dtype=float
+    )
     df = pd.DataFrame(
         index=trustee_accuracies, columns=content_evaluative_capacities, dtype=float
     )
@@ -39,10 +49,22 @@ def figure_heatmap_added_accuracy_content(filename: str = None):
                 trustee_accuracy=trustee_accuracy,
                 content_evaluative_capacity=content_evaluative_capacity,
             ).accuracy_information()
+            data.at[trustee_accuracy, content_evaluative_capacity] = (
+                information_accuracy - trustee_accuracy
+            )
             df.at[trustee_accuracy, content_evaluative_capacity] = round(
                 information_accuracy - trustee_accuracy, 2
             )
 
+    if data_filename:
+        save_dataframe(
+            data_filename,
+            data,
+            index_name="trustee_accuracy",
+            columns_name="content_evaluative_capacity",
+            quantity="information_gain",
+        )
+
     # 2. Configure plot parameters
     cbar_ticks = [0, 0.1, 0.2, 0.3]
     vmin = 0.00
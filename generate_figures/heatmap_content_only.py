@@ -2,12 +2,17 @@ import os
 
 import pandas as pd
 from accuracy_calculator import Agent
+from datasets import save_dataframe
 
 from generate_figures.plot_functions import plot_heatmap
 
 
 def figure_heatmap_content_only(
-    degree_open_mindedness: int = 4, advantage: float = 0, filename: str = None,
+    degree_open_mindedness: int = 4,
+    advantage: float = 0,
+    filename: str = None,
+    data_filename: str = None,
+    correlation: float = 0,
 ):
     """Generates heatmap of epistemic benefit of open_mindedness when only practicing
     content evaluation for a range of competences and content evaluative capacities.
@@ -24,6 +29,12 @@ def figure_heatmap_content_only(
         Option to save the plot
     filename: str
         Location where the plot is to be saved
+    data_filename: str
+        Location where the computed data is to be saved (.npz, or .parquet or .arrow
+        with pyarrow)
+    correlation: float
+        Correlation between the opinions of the consulted neighbors (0 means that
+        they are independent)
 
     Returns
     -------
@@ -33,6 +44,10 @@ def figure_heatmap_content_only(
     competences = [0.6, 0.65, 0.70, 0.75, 0.8, 0.85, 0.9]
     competences.reverse()
     content_evaluative_capacities = [0.5, 0.55, 0.60, 0.65, 0.7, 0.75, 0.8]
+    # Unrounded values are saved; rounded values are plotted
+    data = pd.DataFrame(
+        index=competences, columns=content_evaluative_capacities, dtype=float
+    )
     df = pd.DataFrame(
         index=competences, columns=content_evaluative_capacities, dtype=float
     )
@@ -49,12 +64,29 @@ def figure_heatmap_content_only(
                 competence_unreliable_group=competence - advantage,
                 source_evaluative_capacity=0.5,
                 content_evaluative_capacity=content_evaluative_capacity,
+                correlation=correlation,
             ).benefit_open_mind()
+            data.at[competence, content_evaluative_capacity] = benefit_open_mind
             df.at[competence, content_evaluative_capacity] = round(benefit_open_mind, 2)
 
             if df.at[competence, content_evaluative_capacity] <= 0:
                 mask.at[competence, content_evaluative_capacity] = True
 
+    if data_filename:
+        save_dataframe(
+            data_filename,
+            data,
+            index_name="competence",
+            columns_name="content_evaluative_capacity",
+            quantity="benefit",
+            fixed_parameters={
+                "degree_open_mindedness": degree_open_mindedness,
+                "advantage": advantage,
+                "source_evaluative_capacity": 0.5,
+                "correlation": correlation,
+            },
+        )
+
     # 2. Configure plot parameters
     cbar_ticks = [0, 0.1, 0.20, 0.30]
     vmin = 0.00
@@ -75,6 +107,8 @@ def figure_heatmap_content_only(
     else:
         title = f"{title} in a homogeneous community"
         ylabel = "Competence ($p_R$ and $p_U$)"
+    if correlation:
+        title = f"{title}\n with correlation {correlation} between opinions"
     xlabel = "Content evaluative capacity ($p_{EC}$)"
 
     # 3. Plot heatmap
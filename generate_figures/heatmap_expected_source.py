@@ -0,0 +1,120 @@
+import os
+
+import numpy as np
+import pandas as pd
+from datasets import save_dataframe
+from uncertainty import BetaPrior, expected_benefit_open_mind
+
+from generate_figures.plot_functions import plot_heatmap
+
+
+def figure_heatmap_expected_source(
+    degree_open_mindedness: int,
+    concentration: float = 10,
+    advantage: float = 0,
+    filename: str = None,
+    data_filename: str = None,
+):
+    """Generates heatmap of the expected epistemic benefit of open_mindedness for a
+    range of competences and mean source evaluative capacities, when the source
+    evaluative capacity is Beta-distributed around its mean.
+
+    Parameters
+    ----------
+    degree_open_mindedness: int
+        Degree of open-mindedness
+    concentration: float
+        Concentration (a + b) of the Beta distribution of the source evaluative
+        capacity; the larger, the less uncertain
+    advantage: float
+        The competence advantage of the reliable group
+        (disadvantage is represented by negative advantage)
+    filename: str
+        Location where the plot is to be saved, if you want to save
+    data_filename: str
+        Location where the computed data is to be saved (.npz, or .parquet or .arrow
+        with pyarrow)
+
+    Returns
+    -------
+    Heatmap of expected epistemic benefit"""
+    # 0. Initialize variables
+    competences = [0.6, 0.65, 0.70, 0.75, 0.8, 0.85, 0.9]
+    competences.reverse()
+    source_evaluative_capacities = [0.6, 0.65, 0.70, 0.75, 0.8, 0.85, 0.9]
+
+    # 1. Generate data about expected benefit for all parameter settings at once
+    competence_grid = np.array(competences)[:, None]
+    expected_benefit, _ = expected_benefit_open_mind(
+        priors={
+            "source_evaluative_capacity": BetaPrior.from_mean(
+                source_evaluative_capacities, concentration
+            )
+        },
+        degree_open_mindedness=degree_open_mindedness,
+        competence_unreliable_group=competence_grid - advantage,
+        competence_reliable_group=competence_grid,
+    )
+    # Unrounded values are saved; rounded values are plotted
+    data = pd.DataFrame(
+        expected_benefit, index=competences, columns=source_evaluative_capacities
+    )
+    df = data.round(2)
+    mask = df <= 0
+
+    if data_filename:
+        save_dataframe(
+            data_filename,
+            data,
+            index_name="competence",
+            columns_name="source_evaluative_capacity",
+            quantity="expected_benefit",
+            fixed_parameters={
+                "degree_open_mindedness": degree_open_mindedness,
+                "concentration": concentration,
+                "advantage": advantage,
+            },
+        )
+
+    # 2. Configure plot parameters
+    cbar_ticks = [0, 0.05, 0.1, 0.15]
+    vmin = 0.00
+    vmax = 0.15
+    title = (
+        f"Expected epistemic benefits where degree of open-mindedness ($n$) is "
+        f"{degree_open_mindedness}\n and concentration of $p_{{ES}}$ is "
+        f"{concentration}"
+    )
+    if advantage > 0:
+        title = f"{title} and competence advantage is {advantage}"
+        ylabel = "Competence ($p_R$)"
+    elif advantage < 0:
+        title = f"{title} and competence disadvantage is {-1 * advantage}"
+        ylabel = "Competence ($p_R$)"
+    else:
+        title = f"{title}\n in a homogeneous community"
+        ylabel = "Competence ($p_R$ and $p_U$)"
+    xlabel = "Mean source evaluative capacity ($p_{ES}$)"
+
+    # 3. Plot heatmap
+    plot_heatmap(
+        dataframe=df,
+        title=title,
+        xlabel=xlabel,
+        ylabel=ylabel,
+        vmin=vmin,
+        vmax=vmax,
+        mask=mask,
+        cbar_ticks=cbar_ticks,
+        filename=filename,
+    )
+
+
+if __name__ == "__main__":
+    folder_name = "new_figures"
+    os.makedirs(folder_name, exist_ok=True)
+
+    figure_heatmap_expected_source(
+        degree_open_mindedness=4,
+        filename=f"{folder_name}/Figure_heatmap_expected_source_evaluation_n4",
+    )
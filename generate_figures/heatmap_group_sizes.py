@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pandas as pd
+from datasets import save_dataframe
+from finite_community import benefit_finite_community_array
+
+from generate_figures.plot_functions import plot_heatmap
+
+
+def figure_heatmap_group_sizes(
+    degree_open_mindedness: int = 4,
+    community_size: int = 20,
+    competence: float = 0.7,
+    filename: str = None,
+    data_filename: str = None,
+):
+    """Generates heatmap of epistemic benefit of open_mindedness in a finite
+    community for a range of sizes of the reliable group and source evaluative
+    capacities, when sources are drawn without replacement.
+
+    Parameters
+    ----------
+    degree_open_mindedness: int
+        Degree of open-mindedness
+    community_size: int
+        Number of members of the community (reliable and unreliable group together)
+    competence: float
+        Competence of both groups
+    filename: str
+        Location where the plot is to be saved, if you want to save
+    data_filename: str
+        Location where the computed data is to be saved (.npz, or .parquet or .arrow
+        with pyarrow)
+
+    Returns
+    -------
+    Heatmap of epistemic benefit"""
+    # 0. Initialize variables
+    fractions_reliable = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+    fractions_reliable.reverse()
+    source_evaluative_capacities = [0.6, 0.65, 0.70, 0.75, 0.8, 0.85, 0.9]
+
+    # 1. Generate data about expected accuracy for all parameter settings at once
+    sizes_reliable_group = np.round(np.array(fractions_reliable) * community_size)
+    benefit_open_mind = benefit_finite_community_array(
+        degree_open_mindedness=degree_open_mindedness,
+        competence_unreliable_group=competence,
+        competence_reliable_group=competence,
+        source_evaluative_capacity=np.array(source_evaluative_capacities),
+        size_reliable_group=sizes_reliable_group[:, None],
+        size_unreliable_group=community_size - sizes_reliable_group[:, None],
+    )
+    # Unrounded values are saved; rounded values are plotted
+    data = pd.DataFrame(
+        benefit_open_mind,
+        index=sizes_reliable_group.astype(int),
+        columns=source_evaluative_capacities,
+    )
+    df = data.round(2)
+    mask = df <= 0
+
+    if data_filename:
+        save_dataframe(
+            data_filename,
+            data,
+            index_name="size_reliable_group",
+            columns_name="source_evaluative_capacity",
+            quantity="benefit",
+            fixed_parameters={
+                "degree_open_mindedness": degree_open_mindedness,
+                "community_size": community_size,
+                "competence": competence,
+            },
+        )
+
+    # 2. Configure plot parameters
+    cbar_ticks = [0, 0.05, 0.1, 0.15]
+    vmin = 0.00
+    vmax = 0.15
+    title = (
+        f"Epistemic benefits where degree of open-mindedness ($n$) is "
+        f"{degree_open_mindedness}\n in a community of {community_size} with "
+        f"competence {competence}"
+    )
+    xlabel = "Source evaluative capacity ($p_{ES}$)"
+    ylabel = "Size of the reliable group"
+
+    # 3. Plot heatmap
+    plot_heatmap(
+        dataframe=df,
+        title=title,
+        xlabel=xlabel,
+        ylabel=ylabel,
+        vmin=vmin,
+        vmax=vmax,
+        mask=mask,
+        cbar_ticks=cbar_ticks,
+        filename=filename,
+    )
+
+
+if __name__ == "__main__":
+    folder_name = "new_figures"
+    os.makedirs(folder_name, exist_ok=True)
+
+    figure_heatmap_group_sizes(
+        degree_open_mindedness=4,
+        community_size=20,
+        filename=f"{folder_name}/Figure_heatmap_group_sizes_n4",
+    )
@@ -2,12 +2,17 @@ import os
 
 import pandas as pd
 from accuracy_calculator import Agent
+from datasets import save_dataframe
 
 from generate_figures.plot_functions import plot_heatmap
 
 
 def figure_heatmap_source(
-    degree_open_mindedness: int, advantage: float = 0, filename: str = None,
+    degree_open_mindedness: int,
+    advantage: float = 0,
+    filename: str = None,
+    data_filename: str = None,
+    correlation: float = 0,
 ):
     """Generates heatmap of epistemic benefit of open_mindedness for a range of
     competences and source evaluative capacities.
@@ -22,6 +27,12 @@ def figure_heatmap_source(
 
     filename: str
         Location where the plot is to be saved, if you want to save
+    data_filename: str
+        Location where the computed data is to be saved (.npz, or .parquet or .arrow
+        with pyarrow)
+    correlation: float
+        Correlation between the opinions of the consulted neighbors (0 means that
+        they are independent)
 
     Returns
     -------
@@ -30,6 +41,10 @@ def figure_heatmap_source(
     competences = [0.6, 0.65, 0.70, 0.75, 0.8, 0.85, 0.9]
     competences.reverse()
     source_evaluative_capacities = [0.6, 0.65, 0.70, 0.75, 0.8, 0.85, 0.9]
+    # Unrounded values are saved; rounded values are plotted
+    data = pd.DataFrame(
+        index=competences, columns=source_evaluative_capacities, dtype=float
+    )
     df = pd.DataFrame(
         index=competences, columns=source_evaluative_capacities, dtype=float
     )
@@ -45,12 +60,28 @@ def figure_heatmap_source(
                 competence_unreliable_group=competence - advantage,
                 competence_reliable_group=competence,
                 source_evaluative_capacity=source_evaluative_capacity,
+                correlation=correlation,
             ).benefit_open_mind()
+            data.at[competence, source_evaluative_capacity] = benefit_open_mind
             df.at[competence, source_evaluative_capacity] = round(benefit_open_mind, 2)
             if df.at[competence, source_evaluative_capacity] <= 0:
                 mask.at[competence, source_evaluative_capacity] = True
     # df = pd.DataFrame(data, index=competences, columns=source_evaluative_capacities)
 
+    if data_filename:
+        save_dataframe(
+            data_filename,
+            data,
+            index_name="competence",
+            columns_name="source_evaluative_capacity",
+            quantity="benefit",
+            fixed_parameters={
+                "degree_open_mindedness": degree_open_mindedness,
+                "advantage": advantage,
+                "correlation": correlation,
+            },
+        )
+
     # 2. Configure plot parameters
     cbar_ticks = [0, 0.05, 0.1, 0.15]
     vmin = 0.00
@@ -70,6 +101,8 @@ def figure_heatmap_source(
     else:
         title = f"{title}\n in a homogeneous community"
         ylabel = "Competence ($p_R$ and $p_U$)"
+    if correlation:
+        title = f"{title}\n with correlation {correlation} between opinions"
     xlabel = "Source evaluative capacity ($p_{ES}$)"
 
     # 3. Plot heatmap
@@ -1,13 +1,17 @@
 import os
 
 import pandas as pd
+from datasets import save_dataframe
 from find_tipping_evaluation_content import find_tipping_evaluation_content
 
 from generate_figures.plot_functions import plot_heatmap
 
 
 def figure_heatmap_tipping_evaluation_content(
-    degree_open_mindedness: int = 4, filename: str = None
+    degree_open_mindedness: int = 4,
+    filename: str = None,
+    data_filename: str = None,
+    correlation: float = 0,
 ):
     """Generates heatmap of tipping points for content evaluative capacity where
     open-mindedness becomes epistemically beneficial for an open-minded agent for a
@@ -21,6 +25,12 @@ def figure_heatmap_tipping_evaluation_content(
         Option to save the plot
     filename: str
         Location where the plot is to be saved
+    data_filename: str
+        Location where the computed data is to be saved (.npz, or .parquet or .arrow
+        with pyarrow)
+    correlation: float
+        Correlation between the opinions of the consulted neighbors (0 means that
+        they are independent)
 
     Returns
     -------
@@ -30,6 +40,10 @@ def figure_heatmap_tipping_evaluation_content(
     competences = [0.05 * x + 0.6 for x in range(7)]  # 0.6 till 0.9
     competences.reverse()
     source_evaluative_capacities = [0.05 * x + 0.6 for x in range(7)]  # 0.6 till 0.9
+    # Unrounded values are saved; rounded values are plotted
+    data = pd.DataFrame(
+        index=competences, columns=source_evaluative_capacities, dtype=float
+    )
     df = pd.DataFrame(
         index=competences, columns=source_evaluative_capacities, dtype=float
     )
@@ -45,9 +59,24 @@ def figure_heatmap_tipping_evaluation_content(
                 competence_unreliable_group=competence,
                 source_evaluative_capacity=source_evaluative_capacity,
                 degree_open_mindedness=degree_open_mindedness,
+                correlation=correlation,
             )
+            data.at[competence, source_evaluative_capacity] = tipping_point
             df.at[competence, source_evaluative_capacity] = round(tipping_point, 2)
 
+    if data_filename:
+        save_dataframe(
+            data_filename,
+            data,
+            index_name="competence",
+            columns_name="source_evaluative_capacity",
+            quantity="tipping_content",
+            fixed_parameters={
+                "degree_open_mindedness": degree_open_mindedness,
+                "correlation": correlation,
+            },
+        )
+
     # 2. Configure plot parameters
     cbar_ticks = [0.50, 0.55, 0.60, 0.65]
     vmin = 0.50
@@ -57,6 +86,8 @@ def figure_heatmap_tipping_evaluation_content(
         f"degree of open-mindedness ($n$) is {degree_open_mindedness}\nin a "
         f"homogeneous community"
     )
+    if correlation:
+        title = f"{title} with correlation {correlation} between opinions"
     xlabel = "Source evaluative capacity ($p_{ES}$)"
     ylabel = "Competence ($p_R$ and $p_U$)"
 
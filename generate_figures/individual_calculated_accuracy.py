@@ -3,6 +3,7 @@ import os
 import numpy as np
 import pandas as pd
 from accuracy_calculator import Agent
+from datasets import save_dataframe
 
 from generate_figures.plot_functions import plot_lines
 
@@ -11,6 +12,8 @@ def figure_individual_calculated_accuracy(
     source_evaluative_capacity: float,
     max_degree_open_mindedness: int = 20,
     filename: str = None,
+    data_filename: str = None,
+    correlation: float = 0,
 ):
     """Generates plot of individual accuracy depending on source_evaluative_capacity.
 
@@ -24,6 +27,12 @@ def figure_individual_calculated_accuracy(
         Option to save the plot
     filename: str
         Location where the plot is to be saved
+    data_filename: str
+        Location where the computed data is to be saved (.npz, or .parquet or .arrow
+        with pyarrow)
+    correlation: float
+        Correlation between the opinions of the consulted neighbors (0 means that
+        they are independent)
 
     Returns
     -------
@@ -45,8 +54,22 @@ def figure_individual_calculated_accuracy(
                 competence_reliable_group=competence,
                 competence_unreliable_group=competence,
                 source_evaluative_capacity=source_evaluative_capacity,
+                correlation=correlation,
             ).benefit_open_mind()
 
+    if data_filename:
+        save_dataframe(
+            data_filename,
+            df,
+            index_name="degree_open_mindedness",
+            columns_name="competence",
+            quantity="benefit",
+            fixed_parameters={
+                "source_evaluative_capacity": source_evaluative_capacity,
+                "correlation": correlation,
+            },
+        )
+
     # 2. Configure plot parameters
     if max_degree_open_mindedness != 50:
         xticks = np.arange(0, max_degree_open_mindedness + 1, 2)
@@ -59,6 +82,8 @@ def figure_individual_calculated_accuracy(
         f"Epistemic benefits where the source evaluative capacity ($p_{{ES}}$) is"
         f" {source_evaluative_capacity}\n"
     )
+    if correlation:
+        title = f"{title}and the correlation between opinions is {correlation}\n"
 
     # 3. Line plot
     plot_lines(
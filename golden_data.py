@@ -0,0 +1,369 @@
+import argparse
+import json
+import math
+import os
+
+import numpy as np
+
+GOLDEN_FOLDER = os.path.join(os.path.dirname(__file__), "tests", "data", "golden")
+NUMBER_OF_BISECTIONS = 64
+
+# Every figure quantity on a fine grid. An axis is either a range (start, stop),
+# divided into `resolution` values, or a list of values. The axis 'competence' sets
+# the competences of both groups, as in the figures.
+GOLDEN_DATASETS = {
+    "heatmap_source_n2": {
+        "quantity": "benefit",
+        "axes": {"competence": (0.5, 1), "source_evaluative_capacity": (0, 1)},
+        "fixed_parameters": {"degree_open_mindedness": 2},
+    },
+    "heatmap_source_n4": {
+        "quantity": "benefit",
+        "axes": {"competence": (0.5, 1), "source_evaluative_capacity": (0, 1)},
+        "fixed_parameters": {"degree_open_mindedness": 4},
+    },
+    "heatmap_content_only_n4": {
+        "quantity": "benefit",
+        "axes": {"competence": (0.5, 1), "content_evaluative_capacity": (0, 1)},
+        "fixed_parameters": {
+            "degree_open_mindedness": 4,
+            "source_evaluative_capacity": 0.5,
+        },
+    },
+    "heatmap_tipping_evaluation_content_n4": {
+        "quantity": "tipping_content",
+        "axes": {"competence": (0.5, 1), "source_evaluative_capacity": (0, 1)},
+        "fixed_parameters": {"degree_open_mindedness": 4},
+    },
+    "individual_calculated_accuracy": {
+        "quantity": "benefit",
+        "axes": {
+            "degree_open_mindedness": list(range(51)),
+            "competence": (0.5, 1),
+            "source_evaluative_capacity": [0.3, 0.7, 1.0],
+        },
+        "fixed_parameters": {},
+    },
+    "heatmap_added_accuracy_content": {
+        "quantity": "information_gain",
+        "axes": {
+            "trustee_accuracy": (0.01, 0.99),
+            "content_evaluative_capacity": (0, 1),
+        },
+        "fixed_parameters": {},
+    },
+    "epistemic_potential": {
+        "quantity": "tipping_source",
+        "axes": {
+            "competence_reliable_group": (0.51, 1),
+            "competence_unreliable_group": (0.51, 1),
+        },
+        "fixed_parameters": {},
+    },
+}
+
+
+def reference_accuracy_open_mind(
+    degree_open_mindedness=10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+) -> np.ndarray:
+    """Reference for the accuracy of an open-minded agent, computed independently of
+    `accuracy_calculator.py`: in extended precision (np.longdouble), with exact
+    binomial coefficients, by summing over all numbers of correct neighbors and
+    counting the votes directly."""
+    degree, unreliable, reliable, source, content = np.broadcast_arrays(
+        np.asarray(degree_open_mindedness),
+        *(
+            np.asarray(parameter, dtype=np.longdouble)
+            for parameter in (
+                competence_unreliable_group,
+                competence_reliable_group,
+                source_evaluative_capacity,
+                content_evaluative_capacity,
+            )
+        ),
+    )
+    trustee = source * reliable + (1 - source) * (1 - unreliable)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        information = (trustee * content) / (
+            trustee * content + (1 - trustee) * (1 - content)
+        )
+    accuracy = np.empty(reliable.shape, dtype=np.longdouble)
+    for n in np.unique(degree):
+        n = int(n)
+        cells = degree == n
+        p, me = information[cells], reliable[cells]
+        total = np.zeros(p.shape, dtype=np.longdouble)
+        for number_correct in range(n + 1):
+            probability = (
+                np.longdouble(math.comb(n, number_correct))
+                * p**number_correct
+                * (1 - p) ** (n - number_correct)
+            )
+            for i_am_correct, p_me in [(1, me), (0, 1 - me)]:
+                # Majority of the n + 1 votes, with a coin flip on ties
+                votes = number_correct + i_am_correct
+                if 2 * votes > n + 1:
+                    total += probability * p_me
+                elif 2 * votes == n + 1:
+                    total += probability * p_me / 2
+        accuracy[cells] = total
+    return accuracy
+
+
+def reference_benefit(competence_reliable_group=0.6, **parameters) -> np.ndarray:
+    return reference_accuracy_open_mind(
+        competence_reliable_group=competence_reliable_group, **parameters
+    ) - np.asarray(competence_reliable_group, dtype=np.longdouble)
+
+
+def reference_tipping_content(**parameters) -> np.ndarray:
+    """Reference for the tipping point for content evaluative capacity, by bisection
+    on the content evaluative capacity itself (NaN where it does not exist)."""
+    shape = reference_benefit(**parameters).shape
+    lower = np.zeros(shape, dtype=np.longdouble)
+    upper = np.ones(shape, dtype=np.longdouble)
+    is_reachable = reference_benefit(**parameters, content_evaluative_capacity=1) > 0
+    for _ in range(NUMBER_OF_BISECTIONS):
+        middle = (lower + upper) / 2
+        is_beneficial = (
+            reference_benefit(**parameters, content_evaluative_capacity=middle) > 0
+        )
+        lower = np.where(is_beneficial, lower, middle)
+        upper = np.where(is_beneficial, middle, upper)
+    return np.where(is_reachable, upper, np.nan)
+
+
+def reference_information_gain(
+    trustee_accuracy=0.6, content_evaluative_capacity=0.5
+) -> np.ndarray:
+    trustee_accuracy = np.asarray(trustee_accuracy, dtype=np.longdouble)
+    content_evaluative_capacity = np.asarray(
+        content_evaluative_capacity, dtype=np.longdouble
+    )
+    right_and_accept = trustee_accuracy * content_evaluative_capacity
+    wrong_and_accept = (1 - trustee_accuracy) * (1 - content_evaluative_capacity)
+    return right_and_accept / (right_and_accept + wrong_and_accept) - trustee_accuracy
+
+
+def reference_tipping_source(
+    competence_reliable_group=0.6, competence_unreliable_group=0.7
+) -> np.ndarray:
+    """Reference for the epistemic potential: the source evaluative capacity above
+    which consulted sources are more often right than wrong, by bisection (NaN where
+    it does not exist)."""
+    reliable, unreliable = np.broadcast_arrays(
+        np.asarray(competence_reliable_group, dtype=np.longdouble),
+        np.asarray(competence_unreliable_group, dtype=np.longdouble),
+    )
+
+    def trustee(source):
+        return source * reliable + (1 - source) * (1 - unreliable)
+
+    lower = np.zeros(reliable.shape, dtype=np.longdouble)
+    upper = np.ones(reliable.shape, dtype=np.longdouble)
+    for _ in range(NUMBER_OF_BISECTIONS):
+        middle = (lower + upper) / 2
+        is_above = trustee(middle) > 0.5
+        lower = np.where(is_above, lower, middle)
+        upper = np.where(is_above, middle, upper)
+    return np.where((trustee(1) > 0.5) & (trustee(0) <= 0.5), upper, np.nan)
+
+
+REFERENCES = {
+    "benefit": reference_benefit,
+    "tipping_content": reference_tipping_content,
+    "information_gain": reference_information_gain,
+    "tipping_source": reference_tipping_source,
+}
+
+
+def axis_values(axis, resolution: int) -> np.ndarray:
+    if isinstance(axis, tuple):
+        return np.linspace(*axis, resolution)
+    return np.asarray(axis)
+
+
+def grid_parameters(axes: dict, fixed_parameters: dict) -> dict:
+    """Returns the parameters of the grid spanned by `axes` (name -> 1-d values),
+    each axis along its own dimension, so that they broadcast to the full grid."""
+    parameters = dict(fixed_parameters)
+    for dimension, (name, values) in enumerate(axes.items()):
+        shape = [1] * len(axes)
+        shape[dimension] = -1
+        values = np.reshape(values, shape)
+        if name == "competence":
+            parameters["competence_reliable_group"] = values
+            parameters["competence_unreliable_group"] = values
+        else:
+            parameters[name] = values
+    return parameters
+
+
+def generate_golden_data(
+    folder_name: str = GOLDEN_FOLDER, resolution: int = 101, names: list = None
+) -> list:
+    """Computes the reference grid of every golden dataset (or of those in `names`)
+    with the independent high-precision path and writes each to
+    `<folder_name>/<name>.npz`, together with its axes, fixed parameters and
+    resolution.
+
+    Returns
+    -------
+    filenames: list
+        Locations of the written files"""
+    os.makedirs(folder_name, exist_ok=True)
+    filenames = []
+    for name in names or GOLDEN_DATASETS:
+        dataset = GOLDEN_DATASETS[name]
+        axes = {
+            axis: axis_values(values, resolution)
+            for axis, values in dataset["axes"].items()
+        }
+        values = REFERENCES[dataset["quantity"]](
+            **grid_parameters(axes, dataset["fixed_parameters"])
+        )
+        metadata = {
+            "quantity": dataset["quantity"],
+            "axes": list(axes),
+            "fixed_parameters": dataset["fixed_parameters"],
+            "resolution": resolution,
+        }
+        filename = os.path.join(folder_name, f"{name}.npz")
+        np.savez_compressed(
+            filename,
+            metadata=json.dumps(metadata),
+            values=values.astype(float),
+            **{f"axis_{axis}": values_of_axis for axis, values_of_axis in axes.items()},
+        )
+        filenames.append(filename)
+    return filenames
+
+
+def load_golden_data(name: str, folder_name: str = GOLDEN_FOLDER) -> tuple:
+    """Returns the tuple (values, axes, metadata) of a golden dataset, where axes
+    maps the name of every axis to its values, in the order of the dimensions."""
+    with np.load(os.path.join(folder_name, f"{name}.npz")) as file:
+        metadata = json.loads(str(file["metadata"]))
+        axes = {axis: file[f"axis_{axis}"] for axis in metadata["axes"]}
+        return file["values"], axes, metadata
+
+
+def scalar_backend(function):
+    """Turns a function of scalar parameters (such as a method of `Agent`) into a
+    backend that evaluates it cell by cell on broadcast arrays."""
+    vectorized_function = np.vectorize(function, otypes=[float])
+
+    def backend(**parameters):
+        return vectorized_function(**parameters)
+
+    return backend
+
+
+def compare_to_golden(
+    backend,
+    name: str,
+    rtol: float = 1e-9,
+    atol: float = 1e-12,
+    stride: int = 1,
+    bounds: dict = None,
+    folder_name: str = GOLDEN_FOLDER,
+) -> dict:
+    """Evaluates `backend` on the grid of a golden dataset in one call and compares
+    the result with the reference values cell by cell.
+
+    Parameters
+    ----------
+    backend: callable
+        Function of the parameters of the dataset (as keyword arguments, broadcast
+        arrays) that returns the quantity for every cell, such as
+        `benefit_open_mind_array` or a `scalar_backend`
+    name: str
+        Name of the golden dataset
+    rtol, atol: float
+        Relative and absolute tolerance, as in `np.isclose`
+    stride: int
+        Only every `stride`-th value along every axis is compared, for slow backends
+    bounds: dict
+        Maps names of axes to tuples (minimum, maximum); only the values of these
+        axes within the bounds are compared, for backends that only handle part of
+        the grid
+
+    Returns
+    -------
+    report: dict
+        Number of compared cells and of failures (including cells that are NaN in
+        exactly one of the grids), the largest absolute and relative errors, and the
+        parameters of the cell with the largest absolute error"""
+    # 0. Load the reference values on the selected part of the grid
+    values, axes, metadata = load_golden_data(name, folder_name)
+    bounds = bounds or {}
+    selections = []
+    for axis, values_of_axis in axes.items():
+        minimum, maximum = bounds.get(axis, (-np.inf, np.inf))
+        selection = np.flatnonzero(
+            (values_of_axis >= minimum) & (values_of_axis <= maximum)
+        )[::stride]
+        axes[axis] = values_of_axis[selection]
+        selections.append(selection)
+    expected = values[np.ix_(*selections)]
+
+    # 1. Evaluate the backend on the whole grid at once
+    computed = np.broadcast_to(
+        np.asarray(
+            backend(**grid_parameters(axes, metadata["fixed_parameters"])), dtype=float
+        ),
+        expected.shape,
+    )
+
+    # 2. Compare
+    is_close = np.isclose(computed, expected, rtol=rtol, atol=atol, equal_nan=True)
+    nan_mismatches = np.isnan(computed) != np.isnan(expected)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        absolute_errors = np.where(nan_mismatches, np.inf, np.abs(computed - expected))
+        absolute_errors = np.nan_to_num(absolute_errors, nan=0, posinf=np.inf)
+        relative_errors = np.where(
+            absolute_errors == 0, 0, absolute_errors / np.abs(expected)
+        )
+    worst = np.unravel_index(np.argmax(absolute_errors), expected.shape)
+    return {
+        "number_of_cells": expected.size,
+        "number_of_failures": int((~is_close).sum()),
+        "number_of_nan_mismatches": int(nan_mismatches.sum()),
+        "max_absolute_error": float(absolute_errors.max(initial=0)),
+        "max_relative_error": float(relative_errors.max(initial=0)),
+        "worst_cell": {
+            axis: values_of_axis[index].item()
+            for (axis, values_of_axis), index in zip(axes.items(), worst)
+        },
+    }
+
+
+def assert_matches_golden(backend, name: str, **options):
+    """Raises an AssertionError with the comparison report when `backend` deviates
+    from the golden dataset `name` beyond the tolerances; see `compare_to_golden`."""
+    report = compare_to_golden(backend, name, **options)
+    assert report["number_of_failures"] == 0, f"Mismatch with {name}: {report}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Regenerate the golden reference grids of the figure quantities"
+    )
+    parser.add_argument("--folder", default=GOLDEN_FOLDER)
+    parser.add_argument("--resolution", type=int, default=101)
+    parser.add_argument(
+        "names", nargs="*", help="Datasets to regenerate (all by default)"
+    )
+    arguments = parser.parse_args()
+    for filename in generate_golden_data(
+        arguments.folder, arguments.resolution, arguments.names or None
+    ):
+        print(filename)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+import functools
+
+import numpy as np
+from scipy.special import comb
+from scipy.stats import poisson
+
+from accuracy_calculator import (
+    accuracy_information_array,
+    beta_binomial_pmf,
+    binomial_pmf,
+    trustee_accuracy_array,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def plurality_win_probabilities(
+    degree_open_mindedness: int, number_of_options: int
+) -> np.ndarray:
+    """Returns, for every number c = 0, ..., n + 1 of correct votes among the agent
+    and its n neighbors, the probability that the plurality rule with random
+    tie-breaking picks the correct option, when the other n + 1 - c votes are spread
+    uniformly over the k - 1 wrong options.
+
+    The wrong votes are multinomial, so enumerating them blows up combinatorially.
+    Instead, a multinomial with m votes is the distribution of k - 1 independent
+    Poisson(m / (k - 1)) counts conditioned on their sum being m, and the
+    probability that t wrong options tie with the correct option while all others
+    stay below c is a coefficient of a power of a truncated Poisson pmf. These
+    powers are built by repeated convolution, which takes polynomial time.
+
+    The result only depends on n and k, so it is cached and shared by all cells
+    of a parameter grid.
+
+    Returns
+    -------
+    win_probabilities: np.ndarray
+        Array of length n + 2, indexed by the number of correct votes"""
+    number_of_votes = degree_open_mindedness + 1
+    number_of_wrong_options = number_of_options - 1
+    win_probabilities = np.zeros(number_of_votes + 1)
+    for number_correct in range(1, number_of_votes + 1):
+        number_wrong = number_of_votes - number_correct
+        if number_wrong == 0:
+            win_probabilities[number_correct] = 1
+            continue
+        # 0. Poisson pmf of a single wrong option, and the pmf of the total
+        pmf = poisson.pmf(
+            np.arange(number_wrong + 1), number_wrong / number_of_wrong_options
+        )
+        pmf_total = poisson.pmf(number_wrong, number_wrong)
+        below_correct = np.where(np.arange(number_wrong + 1) < number_correct, pmf, 0)
+        pmf_tie = pmf[number_correct] if number_correct <= number_wrong else 0
+
+        # 1. Powers of the pmf truncated below the number of correct votes
+        powers = [np.eye(1, number_wrong + 1)[0]]
+        for _ in range(number_of_wrong_options):
+            powers.append(np.convolve(powers[-1], below_correct)[: number_wrong + 1])
+
+        # 2. Exactly t wrong options tie with the correct one; the random choice
+        # is correct with probability 1 / (t + 1)
+        for number_tied in range(number_of_wrong_options + 1):
+            remaining = number_wrong - number_tied * number_correct
+            if remaining < 0:
+                break
+            p_number_tied = (
+                comb(number_of_wrong_options, number_tied)
+                * pmf_tie**number_tied
+                * powers[number_of_wrong_options - number_tied][remaining]
+                / pmf_total
+            )
+            win_probabilities[number_correct] += p_number_tied / (number_tied + 1)
+    win_probabilities.flags.writeable = False
+    return win_probabilities
+
+
+def accuracy_plurality_array(
+    degree_open_mindedness=10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    correlation=0,
+    number_of_options: int = 2,
+) -> np.ndarray:
+    """Accuracy of an open-minded agent on a question with `number_of_options`
+    options, who adopts the plurality opinion among its own opinion and those of
+    its neighbors, breaking ties at random. Wrong opinions are spread uniformly over
+    the wrong options. For two options this is `accuracy_open_mind_array`.
+
+    All parameters except `number_of_options` may be scalars or arrays and are
+    broadcast against each other.
+
+    Returns
+    -------
+    accuracy: np.ndarray
+        Accuracy of the open-minded agent for every (broadcast) parameter setting
+    """
+    # 0. Initialize variables
+    if number_of_options < 2:
+        raise ValueError("A question needs at least two options")
+    competence_reliable_group = np.asarray(competence_reliable_group, dtype=float)
+    information_accuracy = accuracy_information_array(
+        trustee_accuracy_array(
+            competence_unreliable_group,
+            competence_reliable_group,
+            source_evaluative_capacity,
+        ),
+        content_evaluative_capacity,
+    )
+    degrees = np.asarray(degree_open_mindedness)
+    correlation = np.asarray(correlation, dtype=float)
+    (
+        degrees,
+        competence_reliable_group,
+        information_accuracy,
+        correlation,
+    ) = np.broadcast_arrays(
+        degrees, competence_reliable_group, information_accuracy, correlation
+    )
+    is_correlated = np.any(correlation != 0)
+
+    # 1. Sum the win probabilities over the number of correct votes, which is the
+    # number of correct neighbors plus one if I am correct. Every degree only
+    # evaluates its own cells
+    accuracy = np.zeros(degrees.shape)
+    for degree in np.unique(degrees):
+        is_degree = degrees == degree
+        win_probabilities = plurality_win_probabilities(int(degree), number_of_options)
+        numbers_correct = np.arange(degree + 2)
+        if is_correlated:
+            pmf = beta_binomial_pmf(
+                numbers_correct,
+                degree,
+                information_accuracy[is_degree][:, None],
+                correlation[is_degree][:, None],
+            )
+        else:
+            pmf = binomial_pmf(
+                numbers_correct, degree, information_accuracy[is_degree][:, None]
+            )
+        competence = competence_reliable_group[is_degree][:, None]
+        p_number_correct = (
+            competence * np.roll(pmf, 1, axis=-1) + (1 - competence) * pmf
+        )
+        accuracy[is_degree] = p_number_correct @ win_probabilities
+    return accuracy
+
+
+def benefit_plurality_array(
+    degree_open_mindedness=10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    correlation=0,
+    number_of_options: int = 2,
+) -> np.ndarray:
+    """Epistemic benefit of open-mindedness on a question with `number_of_options`
+    options; see `accuracy_plurality_array`."""
+    return accuracy_plurality_array(
+        degree_open_mindedness,
+        competence_unreliable_group,
+        competence_reliable_group,
+        source_evaluative_capacity,
+        content_evaluative_capacity,
+        correlation,
+        number_of_options,
+    ) - np.asarray(competence_reliable_group, dtype=float)
@@ -0,0 +1,190 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from accuracy_calculator import accuracy_information_array
+
+
+def homophilous_network(
+    number_of_agents: int = 10000,
+    fraction_reliable: float = 0.5,
+    mean_degree: int = 20,
+    homophily: float = 0.5,
+    seed: int = None,
+) -> tuple:
+    """Generates a random social network with a reliable and an unreliable group.
+
+    Every agent gets `mean_degree` contacts (fewer when duplicates or self-loops
+    are drawn). A contact belongs to the agent's own group with probability
+    `homophily` and to the other group otherwise, and is drawn uniformly within that
+    group. The edges are drawn for all agents at once, so that networks of millions
+    of agents are generated in seconds.
+
+    Parameters
+    ----------
+    number_of_agents: int
+        Size of the population
+    fraction_reliable: float
+        Fraction of the population that belongs to the reliable group
+    mean_degree: int
+        Number of contacts drawn per agent
+    homophily: float
+        Probability that a contact belongs to one's own group
+    seed: int
+        Seed of the random number generator
+
+    Returns
+    -------
+    (adjacency, is_reliable): tuple
+        Sparse adjacency matrix (CSR, row i holds the contacts of agent i) and the
+        boolean array of members of the reliable group"""
+    # 0. Initialize variables
+    rng = np.random.default_rng(seed)
+    number_reliable = int(round(fraction_reliable * number_of_agents))
+    is_reliable = np.zeros(number_of_agents, dtype=bool)
+    is_reliable[:number_reliable] = True
+    groups = [np.arange(number_reliable, number_of_agents), np.arange(number_reliable)]
+
+    # 1. Draw the group and then the member of every contact
+    agents = np.repeat(np.arange(number_of_agents, dtype=np.int32), mean_degree)
+    same_group = rng.random(agents.size) < homophily
+    contact_is_reliable = np.where(
+        same_group, is_reliable[agents], ~is_reliable[agents]
+    )
+    contacts = np.zeros(agents.size, dtype=np.int32)
+    for group_is_reliable, members in enumerate(groups):
+        in_group = contact_is_reliable == bool(group_is_reliable)
+        if members.size > 0:
+            contacts[in_group] = members[rng.integers(0, members.size, in_group.sum())]
+    group_is_empty = np.array([members.size == 0 for members in groups])
+    has_contact = (contacts != agents) & ~group_is_empty[
+        contact_is_reliable.astype(int)
+    ]
+
+    # 2. Assemble the adjacency matrix, merging duplicate contacts
+    adjacency = sparse.csr_matrix(
+        (
+            np.ones(has_contact.sum(), dtype=np.float32),
+            (agents[has_contact], contacts[has_contact]),
+        ),
+        shape=(number_of_agents, number_of_agents),
+    )
+    adjacency.sum_duplicates()
+    adjacency.data[:] = 1
+    return adjacency, is_reliable
+
+
+def group_accuracies(opinions, is_reliable) -> list:
+    """Returns the fraction of correct agents in the population, in the reliable
+    group and in the unreliable group, NaN for a group without agents."""
+    return [opinions.mean()] + [
+        opinions[is_group].mean() if is_group.any() else np.nan
+        for is_group in (is_reliable, ~is_reliable)
+    ]
+
+
+def simulate_deliberation(
+    adjacency,
+    is_reliable,
+    number_of_rounds: int = 10,
+    degree_open_mindedness: int = 10,
+    competence_unreliable_group: float = 0.7,
+    competence_reliable_group: float = 0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    seed: int = None,
+) -> pd.DataFrame:
+    """Simulates a population in which every agent repeatedly consults
+    `degree_open_mindedness` of its contacts and adopts the majority opinion among
+    its own opinion and the opinions it accepts, as in `Agent`.
+
+    Initially, members of the reliable group are correct with probability
+    `competence_reliable_group` and members of the unreliable group with probability
+    1 - `competence_unreliable_group`. In every round, an agent consults a reliable
+    contact with probability equal to its source evaluative capacity (if it has
+    contacts in both groups), and accepts a consulted opinion depending on its content
+    evaluative capacity. The opinions it accepts are drawn independently from the
+    current opinions of its contacts. All agents update simultaneously; a round is
+    one sparse matrix product plus vectorized per-agent filtering and voting.
+
+    Parameters
+    ----------
+    adjacency: scipy.sparse matrix
+        Adjacency matrix of the social network (row i holds the contacts of agent i)
+    is_reliable: np.ndarray
+        Boolean array of members of the reliable group
+    number_of_rounds: int
+        Number of rounds of deliberation
+    degree_open_mindedness: int
+        Number of opinions each agent consults per round
+    competence_unreliable_group: float
+        Competence of the unreliable group
+    competence_reliable_group: float
+        Competence of the reliable group
+    source_evaluative_capacity: float or np.ndarray
+        Source evaluative capacity, possibly per agent
+    content_evaluative_capacity: float or np.ndarray
+        Content evaluative capacity, possibly per agent
+    seed: int
+        Seed of the random number generator
+
+    Returns
+    -------
+    accuracies: pd.DataFrame
+        Fraction of correct agents in the population and in each group (NaN for an
+        empty group), per round (round 0 holds the initial opinions)"""
+    # 0. Initialize variables
+    rng = np.random.default_rng(seed)
+    adjacency = sparse.csr_matrix(adjacency, dtype=np.float32)
+    is_reliable = np.asarray(is_reliable, dtype=bool)
+    number_of_agents = is_reliable.size
+    competence = np.where(
+        is_reliable, competence_reliable_group, 1 - competence_unreliable_group
+    )
+    opinions = rng.random(number_of_agents) < competence
+
+    # The probability of consulting a reliable contact only depends on the network,
+    # so it is computed once
+    group_sizes = adjacency @ np.stack([is_reliable, ~is_reliable], axis=1).astype(
+        np.float32
+    )
+    number_reliable_contacts, number_unreliable_contacts = group_sizes.T
+    p_reliable_contact = np.where(
+        number_unreliable_contacts == 0,
+        1.0,
+        np.where(number_reliable_contacts == 0, 0.0, source_evaluative_capacity),
+    )
+    has_contacts = (number_reliable_contacts + number_unreliable_contacts) > 0
+    weights = np.stack(
+        [
+            p_reliable_contact / np.maximum(number_reliable_contacts, 1),
+            (1 - p_reliable_contact) / np.maximum(number_unreliable_contacts, 1),
+        ],
+        axis=1,
+    )
+
+    # 1. Deliberate
+    accuracies = [group_accuracies(opinions, is_reliable)]
+    for _ in range(number_of_rounds):
+        correct_contacts = adjacency @ np.stack(
+            [opinions & is_reliable, opinions & ~is_reliable], axis=1
+        ).astype(np.float32)
+        trustee_accuracy = np.clip((weights * correct_contacts).sum(axis=1), 0, 1)
+        with np.errstate(invalid="ignore"):
+            information_accuracy = np.nan_to_num(
+                accuracy_information_array(
+                    trustee_accuracy, content_evaluative_capacity
+                )
+            )
+        votes = opinions + rng.binomial(degree_open_mindedness, information_accuracy)
+        ties = 2 * votes == degree_open_mindedness + 1
+        new_opinions = (2 * votes > degree_open_mindedness + 1) | (
+            ties & (rng.random(number_of_agents) < 0.5)
+        )
+        opinions = np.where(has_contacts, new_opinions, opinions)
+        accuracies.append(group_accuracies(opinions, is_reliable))
+    return pd.DataFrame(
+        accuracies,
+        columns=["population", "reliable group", "unreliable group"],
+        index=pd.RangeIndex(number_of_rounds + 1, name="round"),
+    )
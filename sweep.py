@@ -0,0 +1,287 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+
+import accuracy_calculator
+from accuracy_calculator import benefit_open_mind_array
+
+AGENT_PARAMETERS = (
+    "degree_open_mindedness",
+    "competence_unreliable_group",
+    "competence_reliable_group",
+    "source_evaluative_capacity",
+    "content_evaluative_capacity",
+)
+DEFAULT_PARAMETERS = {
+    "degree_open_mindedness": 10,
+    "competence_unreliable_group": 0.7,
+    "competence_reliable_group": 0.6,
+    "source_evaluative_capacity": 0.5,
+    "content_evaluative_capacity": 0.5,
+}
+
+
+def code_hash() -> str:
+    """Returns a hash of the model code, so that shards computed with different
+    versions of `accuracy_calculator.py` are never merged together."""
+    with open(accuracy_calculator.__file__, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def axis_hash(values: np.ndarray) -> str:
+    """Returns a hash of the values of an axis, so that shards of grids with the
+    same shape but different axis values are never merged together."""
+    values = np.ascontiguousarray(values)
+    return hashlib.sha256(values.dtype.str.encode() + values.tobytes()).hexdigest()
+
+
+def shard_bounds(size: int, shard_index: int, number_of_shards: int) -> tuple:
+    """Returns the half-open range [start, stop) of flat grid indices covered by
+    shard `shard_index` (counting from 0) out of `number_of_shards`. The split only
+    depends on its arguments, so every machine computes the same partition without
+    any coordination."""
+    if not 0 <= shard_index < number_of_shards:
+        raise ValueError(
+            f"Shard index {shard_index} out of range for {number_of_shards} shards"
+        )
+    start = (size * shard_index) // number_of_shards
+    stop = (size * (shard_index + 1)) // number_of_shards
+    return start, stop
+
+
+def parse_shard(shard: str) -> tuple:
+    """Parses a shard specification 'i/N' into the tuple (i, N)."""
+    shard_index, number_of_shards = (int(part) for part in shard.split("/"))
+    return shard_index, number_of_shards
+
+
+def shard_filename(folder_name: str, shard_index: int, number_of_shards: int) -> str:
+    return os.path.join(
+        folder_name, f"shard_{shard_index:06d}_of_{number_of_shards:06d}.npz"
+    )
+
+
+def run_shard(
+    axes: dict,
+    shard_index: int,
+    number_of_shards: int,
+    folder_name: str,
+    fixed_parameters: dict = None,
+) -> str:
+    """Computes the epistemic benefit of open-mindedness on one shard of the grid
+    spanned by `axes` and writes it as a self-describing partial result file.
+
+    Parameters
+    ----------
+    axes: dict
+        Maps names of `Agent` parameters to the 1-d array of values of that axis.
+        The full grid is the cartesian product of the axes, in the given order.
+    shard_index: int
+        Index of this shard, counting from 0
+    number_of_shards: int
+        Total number of shards the grid is split into
+    folder_name: str
+        Folder in which the partial result file is written
+    fixed_parameters: dict
+        Values of the `Agent` parameters that are not an axis (defaults to the
+        default parameters of `Agent`)
+
+    Returns
+    -------
+    filename: str
+        Location of the partial result file"""
+    # 0. Initialize variables
+    axes = {name: np.asarray(values) for name, values in axes.items()}
+    for name in axes:
+        if name not in AGENT_PARAMETERS:
+            raise ValueError(f"Unknown parameter {name}")
+    parameters = DEFAULT_PARAMETERS.copy()
+    parameters.update(fixed_parameters or {})
+    fixed_parameters = {
+        name: value for name, value in parameters.items() if name not in axes
+    }
+    shape = tuple(len(values) for values in axes.values())
+    start, stop = shard_bounds(int(np.prod(shape)), shard_index, number_of_shards)
+
+    # 1. Compute the benefit on the flat index range of this shard
+    indices = np.unravel_index(np.arange(start, stop), shape)
+    for (name, values), index in zip(axes.items(), indices):
+        parameters[name] = values[index]
+    values = benefit_open_mind_array(**parameters)
+
+    # 2. Write the partial result; the rename makes a shard appear atomically, so
+    # that an interrupted job never leaves a file that looks complete
+    metadata = {
+        "axes": list(axes),
+        "shape": shape,
+        "axis_hashes": {name: axis_hash(values) for name, values in axes.items()},
+        "fixed_parameters": fixed_parameters,
+        "shard_index": shard_index,
+        "number_of_shards": number_of_shards,
+        "start": start,
+        "stop": stop,
+        "code_hash": code_hash(),
+    }
+    # Serialized before any file is opened, so that invalid metadata leaves nothing
+    # behind; numpy scalars are written as Python numbers
+    metadata = json.dumps(metadata, default=lambda value: value.item())
+    os.makedirs(folder_name, exist_ok=True)
+    filename = shard_filename(folder_name, shard_index, number_of_shards)
+    temporary_filename = f"{filename}.tmp"
+    try:
+        with open(temporary_filename, "wb") as file:
+            np.savez(
+                file,
+                metadata=np.array(metadata),
+                values=values,
+                **{f"axis_{name}": axis for name, axis in axes.items()},
+            )
+    except BaseException:
+        os.remove(temporary_filename)
+        raise
+    os.replace(temporary_filename, filename)
+    return filename
+
+
+def merge_shards(folder_name: str, filename: str = None) -> np.ndarray:
+    """Verifies that the partial result files in `folder_name` are consistent and
+    cover the full grid exactly once, and assembles them into the full grid.
+
+    Only one shard is held in memory at a time: shards are copied straight into the
+    output array, which is memory-mapped to `filename` when given.
+
+    Parameters
+    ----------
+    folder_name: str
+        Folder containing the partial result files
+    filename: str
+        Location of the assembled .npy grid; the axes are written next to it as
+        '<filename>.axes.npz'
+
+    Returns
+    -------
+    grid: np.ndarray
+        Epistemic benefit for every cell of the grid, with one dimension per axis"""
+    # 0. Read the metadata of all shards; loading an .npz is lazy, so the values
+    # of the shards are not read here
+    filenames = sorted(glob.glob(os.path.join(folder_name, "shard_*_of_*.npz")))
+    if not filenames:
+        raise ValueError(f"No shards found in {folder_name}")
+    shards = []
+    for shard_name in filenames:
+        with np.load(shard_name) as shard:
+            shards.append((json.loads(str(shard["metadata"])), shard_name))
+
+    # 1. Verify consistency and coverage
+    reference, reference_name = shards[0]
+    consistent_keys = (
+        "axes",
+        "shape",
+        "axis_hashes",
+        "fixed_parameters",
+        "number_of_shards",
+    )
+    for metadata, shard_name in shards:
+        for key in consistent_keys + ("code_hash",):
+            if metadata[key] != reference[key]:
+                raise ValueError(
+                    f"Shard {shard_name} has {key} {metadata[key]}, but "
+                    f"{reference_name} has {reference[key]}"
+                )
+    shards.sort(key=lambda item: item[0]["start"])
+    size = int(np.prod(reference["shape"]))
+    covered = 0
+    for metadata, shard_name in shards:
+        if metadata["start"] != covered:
+            raise ValueError(
+                f"Grid indices {covered} to {metadata['start']} are "
+                f"{'missing' if metadata['start'] > covered else 'covered twice'} "
+                f"(at {shard_name})"
+            )
+        covered = metadata["stop"]
+    if covered != size:
+        raise ValueError(f"Grid indices {covered} to {size} are missing")
+
+    # 2. Assemble the grid shard by shard
+    shape = tuple(reference["shape"])
+    if filename:
+        grid = np.lib.format.open_memmap(filename, mode="w+", shape=shape)
+    else:
+        grid = np.empty(shape)
+    flat_grid = grid.reshape(-1)
+    axes = {}
+    for metadata, shard_name in shards:
+        with np.load(shard_name) as shard:
+            flat_grid[metadata["start"] : metadata["stop"]] = shard["values"]
+            if not axes:
+                axes = {name: shard[f"axis_{name}"] for name in reference["axes"]}
+    if filename:
+        grid.flush()
+        metadata = {key: reference[key] for key in consistent_keys + ("code_hash",)}
+        np.savez(
+            f"{filename}.axes.npz",
+            metadata=np.array(json.dumps(metadata)),
+            **{f"axis_{name}": axis for name, axis in axes.items()},
+        )
+    return grid
+
+
+def parse_axis(axis: list) -> tuple:
+    """Parses an axis specification 'name start stop num' into the tuple
+    (name, values) with `num` equally spaced values."""
+    name, start, stop, num = axis
+    if name == "degree_open_mindedness":
+        values = np.round(np.linspace(float(start), float(stop), int(num))).astype(int)
+    else:
+        values = np.linspace(float(start), float(stop), int(num))
+    return name, values
+
+
+if __name__ == "__main__":
+    """Command line interface for sharded sweeps. For example, on machine i of N:
+
+        python sweep.py run --shard i/N --folder sweep_results \\
+            --axis competence_reliable_group 0.5 0.9 401 \\
+            --axis source_evaluative_capacity 0 1 1001
+
+    and, once all shards are in (a copy of) the folder:
+
+        python sweep.py merge --folder sweep_results --output benefit.npy"""
+    parser = argparse.ArgumentParser(description="Sharded parameter sweeps")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Compute one shard")
+    run_parser.add_argument("--shard", required=True, help="Shard 'i/N'")
+    run_parser.add_argument("--folder", required=True)
+    run_parser.add_argument(
+        "--axis",
+        nargs=4,
+        action="append",
+        required=True,
+        metavar=("NAME", "START", "STOP", "NUM"),
+    )
+    run_parser.add_argument(
+        "--fixed", nargs=2, action="append", default=[], metavar=("NAME", "VALUE")
+    )
+    merge_parser = subparsers.add_parser("merge", help="Merge all shards")
+    merge_parser.add_argument("--folder", required=True)
+    merge_parser.add_argument("--output", required=True)
+    arguments = parser.parse_args()
+
+    if arguments.command == "run":
+        shard_index, number_of_shards = parse_shard(arguments.shard)
+        run_shard(
+            axes=dict(parse_axis(axis) for axis in arguments.axis),
+            shard_index=shard_index,
+            number_of_shards=number_of_shards,
+            folder_name=arguments.folder,
+            fixed_parameters={
+                name: int(value) if name == "degree_open_mindedness" else float(value)
+                for name, value in arguments.fixed
+            },
+        )
+    else:
+        merge_shards(arguments.folder, filename=arguments.output)
@@ -1,6 +1,14 @@
 import numpy as np
 import pandas as pd
-from accuracy_calculator import Agent
+from accuracy_calculator import (
+    Agent,
+    accuracy_open_mind_array,
+    benefit_open_mind_array,
+    beta_binomial_pmf,
+    beta_binomial_sf,
+    binomial_pmf,
+)
+from scipy.stats import betabinom
 
 
 def test_closed_mind():
@@ -80,3 +88,90 @@ def test_benefit_open_mind():
                 round(Agent(**params).benefit_open_mind(), 2)
                 == df.at[competence, content_evaluative_capacity]
             )
+
+
+def test_benefit_open_mind_array():
+    degrees = np.arange(0, 21)[:, None, None]
+    competences = np.round(np.linspace(0.55, 0.95, 9), 2)[None, :, None]
+    source_evaluative_capacities = np.round(np.linspace(0, 1, 11), 2)[None, None, :]
+    benefits = benefit_open_mind_array(
+        degree_open_mindedness=degrees,
+        competence_unreliable_group=0.7,
+        competence_reliable_group=competences,
+        source_evaluative_capacity=source_evaluative_capacities,
+        content_evaluative_capacity=0.6,
+    )
+    for index in np.ndindex(benefits.shape):
+        agent = Agent(
+            degree_open_mindedness=int(degrees[index[0], 0, 0]),
+            competence_unreliable_group=0.7,
+            competence_reliable_group=competences[0, index[1], 0],
+            source_evaluative_capacity=source_evaluative_capacities[0, 0, index[2]],
+            content_evaluative_capacity=0.6,
+        )
+        assert np.isclose(benefits[index], agent.benefit_open_mind())
+
+
+def test_beta_binomial():
+    for n in [1, 2, 7, 50]:
+        numbers_correct = np.arange(-1, n + 2)
+        for p in [0.3, 0.6, 0.95]:
+            for correlation in [0.01, 0.2, 0.9]:
+                concentration = (1 - correlation) / correlation
+                a, b = p * concentration, (1 - p) * concentration
+                assert np.allclose(
+                    beta_binomial_pmf(numbers_correct, n, p, correlation),
+                    betabinom.pmf(numbers_correct, n, a, b),
+                )
+                assert np.allclose(
+                    beta_binomial_sf(numbers_correct, n, p, correlation),
+                    betabinom.sf(numbers_correct, n, a, b),
+                )
+            assert np.array_equal(
+                beta_binomial_pmf(numbers_correct, n, p, 0),
+                binomial_pmf(numbers_correct, n, p),
+            )
+
+
+def test_beta_binomial_large_degree():
+    # The terms of the tail underflow individually for large n
+    numbers_correct = np.arange(990, 1010)
+    for p in [0.3, 0.5, 0.9]:
+        for correlation in [1e-4, 0.01, 0.3]:
+            concentration = (1 - correlation) / correlation
+            a, b = p * concentration, (1 - p) * concentration
+            assert np.allclose(
+                beta_binomial_sf(numbers_correct, 2000, p, correlation),
+                betabinom.sf(numbers_correct, 2000, a, b),
+                rtol=1e-9,
+                atol=1e-10,
+            )
+    assert np.isclose(beta_binomial_sf(1000, 2000, 0.9, 1e-4), 1)
+    assert np.isclose(
+        accuracy_open_mind_array(2000, 0.7, 0.9, 1.0, 0.9, correlation=1e-4), 1
+    )
+
+
+def test_correlation():
+    for degree_open_mindedness in range(2, 12):
+        params = {
+            "degree_open_mindedness": degree_open_mindedness,
+            "competence_unreliable_group": 0.7,
+            "competence_reliable_group": 0.7,
+            "source_evaluative_capacity": 0.8,
+            "content_evaluative_capacity": 0.6,
+        }
+        independent_agent = Agent(**params)
+        assert (
+            Agent(**params, correlation=0).benefit_open_mind()
+            == independent_agent.benefit_open_mind()
+        )
+        assert (
+            Agent(**params, correlation=0.2).benefit_open_mind()
+            < independent_agent.benefit_open_mind()
+        )
+        for correlation in [0, 0.2, 0.9]:
+            assert np.isclose(
+                benefit_open_mind_array(**params, correlation=correlation),
+                Agent(**params, correlation=correlation).benefit_open_mind(),
+            )
@@ -0,0 +1,82 @@
+import numpy as np
+from accuracy_calculator import (
+    accuracy_information_array,
+    accuracy_open_mind_array,
+    trustee_accuracy_array,
+)
+from aggregation import AggregationRule, accuracy_rules_array
+from scipy.stats import binom
+
+
+def accuracy_rule_enumeration(rule, degree_open_mindedness, competence, p_correct):
+    n = degree_open_mindedness
+    total_weight = n + rule.self_weight
+    accuracy = 0
+    for me_correct, p_me in [(True, competence), (False, 1 - competence)]:
+        for number_correct in range(n + 1):
+            weight_correct = number_correct + rule.self_weight * me_correct
+            weight_wrong = total_weight - weight_correct
+            if weight_correct > rule.threshold * total_weight + 1e-12:
+                p_adopt_correct = 1
+            elif weight_wrong > rule.threshold * total_weight + 1e-12:
+                p_adopt_correct = 0
+            else:
+                p_adopt_correct = {"coin": 0.5, "abstain": 0, "own": me_correct}[
+                    rule.undecided
+                ]
+            accuracy += p_me * binom.pmf(number_correct, n, p_correct) * p_adopt_correct
+    return accuracy
+
+
+def test_rules_enumeration():
+    rules = [
+        AggregationRule(threshold, self_weight, undecided)
+        for threshold in [0.5, 2 / 3, 0.75]
+        for self_weight in [0, 1, 2.5]
+        for undecided in ["coin", "abstain", "own"]
+    ]
+    competence, source_evaluative_capacity = 0.7, 0.8
+    information_accuracy = accuracy_information_array(
+        trustee_accuracy_array(competence, competence, source_evaluative_capacity), 0.6
+    )
+    for degree_open_mindedness in range(8):
+        accuracies = accuracy_rules_array(
+            rules,
+            degree_open_mindedness=degree_open_mindedness,
+            competence_unreliable_group=competence,
+            competence_reliable_group=competence,
+            source_evaluative_capacity=source_evaluative_capacity,
+            content_evaluative_capacity=0.6,
+        )
+        for rule, accuracy in zip(rules, accuracies):
+            assert np.isclose(
+                accuracy,
+                accuracy_rule_enumeration(
+                    rule, degree_open_mindedness, competence, information_accuracy
+                ),
+            ), rule
+
+
+def test_majority_rule():
+    competences = np.linspace(0.5, 0.95, 10)[:, None]
+    source_evaluative_capacities = np.linspace(0, 1, 11)
+    for degree_open_mindedness in range(20):
+        for correlation in [0, 0.3]:
+            (accuracy,) = accuracy_rules_array(
+                [AggregationRule()],
+                degree_open_mindedness=degree_open_mindedness,
+                competence_unreliable_group=competences,
+                competence_reliable_group=competences,
+                source_evaluative_capacity=source_evaluative_capacities,
+                correlation=correlation,
+            )
+            assert np.allclose(
+                accuracy,
+                accuracy_open_mind_array(
+                    degree_open_mindedness=degree_open_mindedness,
+                    competence_unreliable_group=competences,
+                    competence_reliable_group=competences,
+                    source_evaluative_capacity=source_evaluative_capacities,
+                    correlation=correlation,
+                ),
+            )
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datasets import load_dataframe, load_dataset, save_dataframe, save_dataset
+
+axes = {
+    "competence_reliable_group": np.linspace(0.5, 1, 11),
+    "source_evaluative_capacity": np.linspace(0, 1, 21),
+    "degree_open_mindedness": np.array([2, 3, 4]),
+}
+values = np.random.default_rng(0).random((11, 21, 3))
+
+
+def test_npz(tmp_path):
+    for array in [values, np.asfortranarray(values)]:
+        filename = save_dataset(
+            str(tmp_path / "benefit.npz"),
+            array,
+            axes,
+            fixed_parameters={"content_evaluative_capacity": np.float64(0.6)},
+        )
+        loaded_values, loaded_axes, metadata = load_dataset(filename)
+        assert isinstance(loaded_values, np.memmap)
+        assert np.array_equal(loaded_values, values)
+        for name, axis_values in axes.items():
+            assert np.array_equal(loaded_axes[name], axis_values)
+        assert metadata["quantity"] == "benefit"
+        assert metadata["fixed_parameters"] == {"content_evaluative_capacity": 0.6}
+    with pytest.raises(ValueError):
+        save_dataset(str(tmp_path / "benefit.npz"), values[:, :, :2], axes)
+
+
+def test_dataframe(tmp_path):
+    df = pd.DataFrame(values[:, :, 0], index=axes["competence_reliable_group"])
+    df.columns = axes["source_evaluative_capacity"]
+    filename = save_dataframe(
+        str(tmp_path / "heatmap"),
+        df,
+        index_name="competence_reliable_group",
+        columns_name="source_evaluative_capacity",
+    )
+    assert filename.endswith(".npz")
+    loaded_df = load_dataframe(filename)
+    assert np.array_equal(loaded_df.to_numpy(), df.to_numpy())
+    assert loaded_df.index.name == "competence_reliable_group"
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".arrow"])
+def test_pyarrow(tmp_path, extension):
+    pytest.importorskip("pyarrow")
+    filename = save_dataset(str(tmp_path / f"benefit{extension}"), values, axes)
+    loaded_values, loaded_axes, metadata = load_dataset(filename)
+    assert np.array_equal(loaded_values, values)
+    assert np.array_equal(loaded_axes["degree_open_mindedness"], [2, 3, 4])
+    assert metadata["axes"] == list(axes)
@@ -0,0 +1,23 @@
+from find_tipping_evaluation_content import find_tipping_evaluation_content
+from golden_data import assert_matches_golden, scalar_backend
+from thresholds import tipping_content_evaluative_capacity_array
+
+
+def test_find_tipping_evaluation_content():
+    # The step-wise search rounds up to a multiple of the step size 0.01, and only
+    # terminates where a tipping point exists, as in the range of the figure
+    assert_matches_golden(
+        scalar_backend(find_tipping_evaluation_content),
+        "heatmap_tipping_evaluation_content_n4",
+        atol=0.01,
+        stride=5,
+        bounds={"competence": (0.6, 0.9), "source_evaluative_capacity": (0.6, 0.9)},
+    )
+
+
+def test_tipping_content_evaluative_capacity_array():
+    assert_matches_golden(
+        tipping_content_evaluative_capacity_array,
+        "heatmap_tipping_evaluation_content_n4",
+        atol=1e-9,
+    )
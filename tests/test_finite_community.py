@@ -0,0 +1,112 @@
+import itertools
+
+import numpy as np
+import pytest
+from accuracy_calculator import accuracy_open_mind_array
+from finite_community import (
+    accuracy_finite_community_array,
+    number_reliable_sources_pmf,
+)
+from scipy.stats import nchypergeom_fisher
+
+
+def test_number_reliable_sources_pmf():
+    for size_reliable_group, size_unreliable_group in [(30, 12), (3, 3), (100000, 5)]:
+        for degree_open_mindedness in [1, 4, 6]:
+            assert np.allclose(
+                number_reliable_sources_pmf(
+                    degree_open_mindedness,
+                    size_reliable_group,
+                    size_unreliable_group,
+                    0.6,
+                    0.2,
+                ),
+                nchypergeom_fisher.pmf(
+                    np.arange(degree_open_mindedness + 1),
+                    size_reliable_group + size_unreliable_group,
+                    size_reliable_group,
+                    degree_open_mindedness,
+                    3,
+                ),
+            )
+
+
+def test_small_community():
+    # Two reliable and two unreliable members: enumerate all pairs of sources and
+    # all opinions, with the weights of the noncentral hypergeometric distribution
+    competence, source_evaluative_capacity, content_evaluative_capacity = 0.7, 0.8, 0.6
+    accuracy_member = [competence] * 2 + [1 - competence] * 2
+    accept = [
+        accuracy * content_evaluative_capacity
+        + (1 - accuracy) * (1 - content_evaluative_capacity)
+        for accuracy in accuracy_member
+    ]
+    weights = [
+        source_evaluative_capacity * accept[0],
+        source_evaluative_capacity * accept[1],
+        (1 - source_evaluative_capacity) * accept[2],
+        (1 - source_evaluative_capacity) * accept[3],
+    ]
+    accuracy = 0
+    pairs = list(itertools.combinations(range(4), 2))
+    total_weight = sum(weights[first] * weights[second] for first, second in pairs)
+    for first, second in pairs:
+        p_pair = weights[first] * weights[second] / total_weight
+        for opinions in itertools.product([0, 1], repeat=3):
+            p_opinions = competence if opinions[0] else 1 - competence
+            for member, opinion in zip([first, second], opinions[1:]):
+                p_correct = (
+                    accuracy_member[member] * content_evaluative_capacity
+                ) / accept[member]
+                p_opinions *= p_correct if opinion else 1 - p_correct
+            accuracy += p_pair * p_opinions * (sum(opinions) >= 2)
+    assert np.isclose(
+        accuracy_finite_community_array(
+            degree_open_mindedness=2,
+            competence_unreliable_group=competence,
+            competence_reliable_group=competence,
+            source_evaluative_capacity=source_evaluative_capacity,
+            content_evaluative_capacity=content_evaluative_capacity,
+            size_reliable_group=2,
+            size_unreliable_group=2,
+        ),
+        accuracy,
+    )
+
+
+def test_infinite_community():
+    competences = np.linspace(0.55, 0.95, 9)[:, None]
+    source_evaluative_capacities = np.linspace(0.05, 0.95, 10)
+    for degree_open_mindedness in range(12):
+        assert np.allclose(
+            accuracy_finite_community_array(
+                degree_open_mindedness=degree_open_mindedness,
+                competence_unreliable_group=competences,
+                competence_reliable_group=competences,
+                source_evaluative_capacity=source_evaluative_capacities,
+                content_evaluative_capacity=0.65,
+                size_reliable_group=10**8,
+                size_unreliable_group=10**8,
+            ),
+            accuracy_open_mind_array(
+                degree_open_mindedness=degree_open_mindedness,
+                competence_unreliable_group=competences,
+                competence_reliable_group=competences,
+                source_evaluative_capacity=source_evaluative_capacities,
+                content_evaluative_capacity=0.65,
+            ),
+            atol=1e-7,
+        )
+
+
+def test_community_too_small():
+    with pytest.raises(ValueError):
+        accuracy_finite_community_array(
+            degree_open_mindedness=5, size_reliable_group=2, size_unreliable_group=2
+        )
+    # Consulting every member is possible
+    assert np.isfinite(
+        accuracy_finite_community_array(
+            degree_open_mindedness=4, size_reliable_group=2, size_unreliable_group=2
+        )
+    )
@@ -0,0 +1,43 @@
+import numpy as np
+from accuracy_calculator import accuracy_open_mind_array
+from fitting import fit_accuracy
+
+degrees = np.arange(0, 21)
+true_parameters = {
+    "competence_reliable_group": 0.65,
+    "source_evaluative_capacity": 0.8,
+}
+fixed_parameters = {
+    "competence_unreliable_group": 0.7,
+    "content_evaluative_capacity": 0.6,
+}
+accuracies = accuracy_open_mind_array(
+    degree_open_mindedness=degrees, **true_parameters, **fixed_parameters
+)
+
+
+def test_least_squares():
+    estimates = fit_accuracy(
+        degrees, accuracies, fixed_parameters=fixed_parameters, processes=1, seed=0
+    )
+    for name, value in true_parameters.items():
+        assert abs(estimates.at[name, "estimate"] - value) < 1e-3
+
+
+def test_likelihood_bootstrap():
+    rng = np.random.default_rng(0)
+    numbers_of_trials = np.full(degrees.size, 10000)
+    observed_accuracies = rng.binomial(numbers_of_trials, accuracies) / 10000
+    estimates = fit_accuracy(
+        degrees,
+        observed_accuracies,
+        numbers_of_trials,
+        fixed_parameters=fixed_parameters,
+        number_of_starts=4,
+        number_of_bootstrap_samples=50,
+        processes=2,
+        seed=0,
+    )
+    for name, value in true_parameters.items():
+        assert abs(estimates.at[name, "estimate"] - value) < 0.05
+        assert estimates.at[name, "lower"] <= value <= estimates.at[name, "upper"]
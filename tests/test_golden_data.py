@@ -0,0 +1,73 @@
+import numpy as np
+from accuracy_calculator import (
+    Agent,
+    accuracy_information_array,
+    benefit_open_mind_array,
+)
+from golden_data import (
+    GOLDEN_DATASETS,
+    assert_matches_golden,
+    compare_to_golden,
+    generate_golden_data,
+    load_golden_data,
+    scalar_backend,
+)
+
+from generate_figures.epistemic_potential import calculate_tipping_source
+
+
+def test_generate_golden_data(tmp_path):
+    # The committed reference grids can be regenerated; the precision of
+    # np.longdouble depends on the platform, so the grids are not bit-for-bit equal
+    golden_values, _, metadata = load_golden_data("heatmap_source_n2")
+    generate_golden_data(
+        str(tmp_path), resolution=metadata["resolution"], names=["heatmap_source_n2"]
+    )
+    values, axes, _ = load_golden_data("heatmap_source_n2", str(tmp_path))
+    assert np.allclose(
+        values,
+        golden_values,
+        rtol=1e-12,
+        atol=1e-14,
+        equal_nan=True,
+    )
+    assert values.shape == tuple(axis.size for axis in axes.values())
+
+
+def test_vectorized_backends():
+    for name, dataset in GOLDEN_DATASETS.items():
+        if dataset["quantity"] == "benefit":
+            assert_matches_golden(benefit_open_mind_array, name)
+    assert_matches_golden(
+        lambda trustee_accuracy, content_evaluative_capacity: (
+            accuracy_information_array(trustee_accuracy, content_evaluative_capacity)
+            - trustee_accuracy
+        ),
+        "heatmap_added_accuracy_content",
+    )
+    assert_matches_golden(calculate_tipping_source, "epistemic_potential")
+
+
+def test_scalar_backend():
+    assert_matches_golden(
+        scalar_backend(lambda **parameters: Agent(**parameters).benefit_open_mind()),
+        "individual_calculated_accuracy",
+        stride=4,
+    )
+
+
+def test_compare_to_golden():
+    report = compare_to_golden(
+        lambda **parameters: np.round(benefit_open_mind_array(**parameters), 2),
+        "heatmap_source_n4",
+    )
+    assert report["number_of_failures"] > 0
+    assert report["max_absolute_error"] <= 0.005 + 1e-12
+    assert (
+        compare_to_golden(
+            lambda **parameters: np.round(benefit_open_mind_array(**parameters), 2),
+            "heatmap_source_n4",
+            atol=0.005 + 1e-12,
+        )["number_of_failures"]
+        == 0
+    )
@@ -0,0 +1,89 @@
+import itertools
+
+import numpy as np
+from accuracy_calculator import (
+    accuracy_information_array,
+    accuracy_open_mind_array,
+    trustee_accuracy_array,
+)
+from plurality import accuracy_plurality_array
+
+
+def accuracy_plurality_enumeration(
+    degree_open_mindedness, number_of_options, competence, information_accuracy
+):
+    # Enumerate all votes; option 0 is correct, the others are wrong
+    number_of_wrong_options = number_of_options - 1
+    p_own_vote = [competence] + [(1 - competence) / number_of_wrong_options] * (
+        number_of_wrong_options
+    )
+    p_neighbor_vote = [information_accuracy] + [
+        (1 - information_accuracy) / number_of_wrong_options
+    ] * number_of_wrong_options
+    accuracy = 0
+    for votes in itertools.product(
+        range(number_of_options), repeat=degree_open_mindedness + 1
+    ):
+        p_votes = p_own_vote[votes[0]] * np.prod(
+            [p_neighbor_vote[vote] for vote in votes[1:]]
+        )
+        counts = np.bincount(votes, minlength=number_of_options)
+        plurality = np.flatnonzero(counts == counts.max())
+        if 0 in plurality:
+            accuracy += p_votes / len(plurality)
+    return accuracy
+
+
+def test_plurality_enumeration():
+    params = {
+        "competence_unreliable_group": 0.65,
+        "competence_reliable_group": 0.7,
+        "source_evaluative_capacity": 0.8,
+        "content_evaluative_capacity": 0.6,
+    }
+    information_accuracy = accuracy_information_array(
+        trustee_accuracy_array(
+            params["competence_unreliable_group"],
+            params["competence_reliable_group"],
+            params["source_evaluative_capacity"],
+        ),
+        params["content_evaluative_capacity"],
+    )
+    for degree_open_mindedness in range(6):
+        for number_of_options in [2, 3, 4]:
+            assert np.isclose(
+                accuracy_plurality_array(
+                    degree_open_mindedness=degree_open_mindedness,
+                    number_of_options=number_of_options,
+                    **params,
+                ),
+                accuracy_plurality_enumeration(
+                    degree_open_mindedness,
+                    number_of_options,
+                    params["competence_reliable_group"],
+                    information_accuracy,
+                ),
+            )
+
+
+def test_two_options():
+    degrees = np.arange(0, 31)[:, None, None]
+    competences = np.linspace(0.5, 0.95, 10)[None, :, None]
+    source_evaluative_capacities = np.linspace(0, 1, 11)
+    for correlation in [0, 0.3]:
+        assert np.allclose(
+            accuracy_plurality_array(
+                degree_open_mindedness=degrees,
+                competence_unreliable_group=competences,
+                competence_reliable_group=competences,
+                source_evaluative_capacity=source_evaluative_capacities,
+                correlation=correlation,
+            ),
+            accuracy_open_mind_array(
+                degree_open_mindedness=degrees,
+                competence_unreliable_group=competences,
+                competence_reliable_group=competences,
+                source_evaluative_capacity=source_evaluative_capacities,
+                correlation=correlation,
+            ),
+        )
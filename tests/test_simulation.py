@@ -0,0 +1,58 @@
+import warnings
+
+import numpy as np
+from accuracy_calculator import Agent
+from simulation import homophilous_network, simulate_deliberation
+
+
+def test_homophilous_network():
+    adjacency, is_reliable = homophilous_network(
+        number_of_agents=10000,
+        fraction_reliable=0.3,
+        mean_degree=10,
+        homophily=0.8,
+        seed=0,
+    )
+    assert adjacency.shape == (10000, 10000)
+    assert is_reliable.sum() == 3000
+    assert adjacency.diagonal().sum() == 0
+    rows, columns = adjacency.nonzero()
+    same_group = is_reliable[rows] == is_reliable[columns]
+    assert abs(same_group.mean() - 0.8) < 0.01
+
+
+def test_simulate_deliberation():
+    params = {
+        "degree_open_mindedness": 10,
+        "competence_unreliable_group": 0.7,
+        "competence_reliable_group": 0.6,
+        "source_evaluative_capacity": 0.8,
+        "content_evaluative_capacity": 0.6,
+    }
+    adjacency, is_reliable = homophilous_network(
+        number_of_agents=4000, mean_degree=2000, homophily=0.5, seed=0
+    )
+    accuracies = simulate_deliberation(
+        adjacency, is_reliable, number_of_rounds=3, seed=0, **params
+    )
+    assert list(accuracies.index) == [0, 1, 2, 3]
+    assert abs(accuracies.at[0, "reliable group"] - 0.6) < 0.05
+    assert abs(accuracies.at[0, "unreliable group"] - 0.3) < 0.05
+    # With many contacts, the first round of the reliable group follows the model
+    assert (
+        abs(accuracies.at[1, "reliable group"] - Agent(**params).accuracy_open_mind())
+        < 0.03
+    )
+
+
+def test_simulate_deliberation_empty_group():
+    adjacency, is_reliable = homophilous_network(
+        number_of_agents=1000, fraction_reliable=0, mean_degree=10, seed=0
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        accuracies = simulate_deliberation(
+            adjacency, is_reliable, number_of_rounds=2, seed=0
+        )
+    assert accuracies["reliable group"].isna().all()
+    assert np.allclose(accuracies["unreliable group"], accuracies["population"])
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from accuracy_calculator import benefit_open_mind_array
+from sweep import merge_shards, run_shard, shard_bounds
+
+axes = {
+    "competence_reliable_group": np.round(np.linspace(0.6, 0.9, 7), 2),
+    "source_evaluative_capacity": np.round(np.linspace(0.6, 0.9, 7), 2),
+    "degree_open_mindedness": np.array([2, 3, 4]),
+}
+
+
+def test_shard_bounds():
+    for number_of_shards in [1, 2, 7, 147, 200]:
+        bounds = [
+            shard_bounds(147, shard_index, number_of_shards)
+            for shard_index in range(number_of_shards)
+        ]
+        assert bounds[0][0] == 0 and bounds[-1][1] == 147
+        for (_, stop), (start, _) in zip(bounds, bounds[1:]):
+            assert stop == start
+
+
+def test_merge_shards(tmp_path):
+    number_of_shards = 5
+    for shard_index in reversed(range(number_of_shards)):
+        run_shard(axes, shard_index, number_of_shards, str(tmp_path))
+    grid = merge_shards(str(tmp_path), filename=str(tmp_path / "benefit.npy"))
+
+    expected = benefit_open_mind_array(
+        competence_reliable_group=axes["competence_reliable_group"][:, None, None],
+        source_evaluative_capacity=axes["source_evaluative_capacity"][None, :, None],
+        degree_open_mindedness=axes["degree_open_mindedness"][None, None, :],
+    )
+    assert np.allclose(grid, expected)
+    assert np.allclose(np.load(tmp_path / "benefit.npy"), expected)
+
+
+def test_merge_shards_incomplete(tmp_path):
+    run_shard(axes, 0, 3, str(tmp_path))
+    run_shard(axes, 2, 3, str(tmp_path))
+    with pytest.raises(ValueError):
+        merge_shards(str(tmp_path))
+
+
+def test_merge_shards_inconsistent(tmp_path):
+    run_shard(axes, 0, 2, str(tmp_path))
+    run_shard(
+        axes, 1, 2, str(tmp_path), fixed_parameters={"competence_unreliable_group": 0.8}
+    )
+    with pytest.raises(ValueError):
+        merge_shards(str(tmp_path))
+
+
+def test_merge_shards_different_axis_values(tmp_path):
+    run_shard(axes, 0, 2, str(tmp_path))
+    shifted_axes = {
+        **axes,
+        "competence_reliable_group": np.round(np.linspace(0.65, 0.95, 7), 2),
+    }
+    run_shard(shifted_axes, 1, 2, str(tmp_path))
+    with pytest.raises(ValueError, match="axis_hashes"):
+        merge_shards(str(tmp_path))
+
+
+def test_run_shard_numpy_fixed_parameter(tmp_path):
+    small_axes = {"competence_reliable_group": axes["competence_reliable_group"]}
+    fixed_parameters = {"degree_open_mindedness": np.arange(5)[2]}
+    run_shard(small_axes, 0, 2, str(tmp_path), fixed_parameters=fixed_parameters)
+    run_shard(
+        small_axes, 1, 2, str(tmp_path), fixed_parameters={"degree_open_mindedness": 2}
+    )
+    assert not list(tmp_path.glob("*.tmp"))
+    assert np.allclose(
+        merge_shards(str(tmp_path)),
+        benefit_open_mind_array(
+            degree_open_mindedness=2,
+            competence_reliable_group=axes["competence_reliable_group"],
+        ),
+    )
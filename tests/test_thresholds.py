@@ -0,0 +1,130 @@
+import numpy as np
+from accuracy_calculator import benefit_open_mind_array
+from find_tipping_evaluation_content import find_tipping_evaluation_content
+from thresholds import (
+    minimum_degree_array,
+    threshold_volume,
+    tipping_content_evaluative_capacity_array,
+    tipping_source_evaluative_capacity_array,
+)
+
+from generate_figures.epistemic_potential import calculate_tipping_source
+
+
+def test_tipping_content_evaluative_capacity_array():
+    for degree_open_mindedness in [1, 2, 3, 10]:
+        for competence_unreliable_group, competence_reliable_group, source in [
+            (0.7, 0.6, 0.5),
+            (0.6, 0.7, 0.3),
+            (0.8, 0.55, 0.9),
+        ]:
+            tipping_point = tipping_content_evaluative_capacity_array(
+                degree_open_mindedness,
+                competence_unreliable_group,
+                competence_reliable_group,
+                source,
+            )
+            # The step-wise search returns the tipping point rounded up to 0.01
+            assert np.isclose(
+                np.ceil(tipping_point * 100) / 100,
+                find_tipping_evaluation_content(
+                    degree_open_mindedness=degree_open_mindedness,
+                    competence_unreliable_group=competence_unreliable_group,
+                    competence_reliable_group=competence_reliable_group,
+                    source_evaluative_capacity=source,
+                ),
+            )
+    assert np.isnan(tipping_content_evaluative_capacity_array(0))
+
+
+def test_tipping_source_evaluative_capacity_array():
+    competences = np.linspace(0.51, 0.99, 25)
+    assert np.allclose(
+        tipping_source_evaluative_capacity_array(
+            np.inf, competences[None, :], competences[:, None]
+        ),
+        calculate_tipping_source(competences[:, None], competences[None, :]),
+    )
+    sources = np.linspace(0, 1, 1001)
+    for degree_open_mindedness in [1, 2, 5]:
+        for competence_unreliable_group, competence_reliable_group, content in [
+            (0.7, 0.6, 0.5),
+            (0.4, 0.8, 0.7),
+            (0.2, 0.6, 0.6),
+            (0.9, 0.9, 0.3),
+        ]:
+            tipping_point = tipping_source_evaluative_capacity_array(
+                degree_open_mindedness,
+                competence_unreliable_group,
+                competence_reliable_group,
+                content,
+            )
+            is_beneficial = (
+                benefit_open_mind_array(
+                    degree_open_mindedness,
+                    competence_unreliable_group,
+                    competence_reliable_group,
+                    sources,
+                    content,
+                )
+                > 1e-12
+            )
+            if np.isnan(tipping_point):
+                assert not is_beneficial.any()
+            else:
+                assert is_beneficial[sources > tipping_point + 1e-6].all()
+                assert not is_beneficial[sources < tipping_point - 1e-6].any()
+
+
+def test_minimum_degree_array():
+    rng = np.random.default_rng(0)
+    parameters = rng.uniform(0.05, 0.95, (4, 200))
+    minimum_degrees = minimum_degree_array(*parameters, max_degree=30)
+    degrees = np.arange(1, 31)[:, None]
+    is_beneficial = benefit_open_mind_array(degrees, *parameters) > 0
+    expected = np.where(
+        is_beneficial.any(axis=0), is_beneficial.argmax(axis=0) + 1, np.nan
+    )
+    assert np.array_equal(minimum_degrees, expected, equal_nan=True)
+
+
+def test_threshold_volume(tmp_path):
+    axes = {
+        "degree_open_mindedness": np.array([1, 2, 4, 9]),
+        "competence_reliable_group": np.linspace(0.5, 1, 11),
+        "source_evaluative_capacity": np.linspace(0, 1, 21),
+    }
+    grid = {
+        name: np.reshape(values, [-1 if i == j else 1 for j in range(3)])
+        for i, (name, values) in enumerate(axes.items())
+    }
+    volume = threshold_volume(
+        "tipping_content",
+        axes,
+        {"competence_unreliable_group": 0.6},
+        filename=str(tmp_path / "volume.npy"),
+        dtype="float64",
+    )
+    assert np.allclose(
+        volume,
+        tipping_content_evaluative_capacity_array(
+            competence_unreliable_group=0.6, **grid
+        ),
+        equal_nan=True,
+    )
+    assert np.array_equal(np.load(tmp_path / "volume.npy"), volume, equal_nan=True)
+
+    del axes["degree_open_mindedness"]
+    volume = threshold_volume(
+        "minimum_degree", axes, {"content_evaluative_capacity": 0.7, "max_degree": 20}
+    )
+    assert np.allclose(
+        volume,
+        minimum_degree_array(
+            competence_reliable_group=axes["competence_reliable_group"][:, None],
+            source_evaluative_capacity=axes["source_evaluative_capacity"][None, :],
+            content_evaluative_capacity=0.7,
+            max_degree=20,
+        ),
+        equal_nan=True,
+    )
@@ -0,0 +1,71 @@
+import numpy as np
+from accuracy_calculator import benefit_open_mind_array
+from tiles import TilePyramid, build_tile_pyramid
+
+
+def test_tile_pyramid(tmp_path):
+    build_tile_pyramid(
+        str(tmp_path),
+        ("source_evaluative_capacity", 0, 1),
+        ("competence", 0.5, 1),
+        fixed_parameters={"degree_open_mindedness": 4},
+        number_of_levels=3,
+        tile_size=16,
+        dtype="float64",
+    )
+    pyramid = TilePyramid(str(tmp_path))
+
+    level, tiles = pyramid.tiles_in_viewport(0.3, 0.6, 0.55, 0.7, resolution=10)
+    assert level == 2
+    assert tiles == [(0, 1), (0, 2), (1, 1), (1, 2)]
+
+    values, (x_min, x_max, y_min, y_max) = pyramid.viewport(
+        "benefit", 0.3, 0.6, 0.55, 0.7, resolution=10
+    )
+    assert x_min <= 0.3 and x_max >= 0.6 and y_min <= 0.55 and y_max >= 0.7
+    number_of_cells = 16 * 2**level
+    sources = x_min + (np.arange(values.shape[1]) + 0.5) / number_of_cells
+    competences = y_min + (np.arange(values.shape[0]) + 0.5) * 0.5 / number_of_cells
+    assert np.allclose(
+        values,
+        benefit_open_mind_array(
+            degree_open_mindedness=4,
+            competence_unreliable_group=competences[:, None],
+            competence_reliable_group=competences[:, None],
+            source_evaluative_capacity=sources[None, :],
+        ),
+    )
+    assert pyramid.viewport("tipping", 0, 1, 0.5, 1, resolution=16)[0].shape == (
+        16,
+        16,
+    )
+
+
+def test_viewport_outside_slice(tmp_path):
+    build_tile_pyramid(
+        str(tmp_path),
+        ("source_evaluative_capacity", 0, 1),
+        ("competence", 0.5, 1),
+        number_of_levels=2,
+        tile_size=8,
+    )
+    pyramid = TilePyramid(str(tmp_path))
+    for x_min, x_max in [(1.1, 1.3), (-0.3, -0.1)]:
+        assert pyramid.tiles_in_viewport(x_min, x_max, 0.6, 0.7)[1] == []
+        assert pyramid.viewport("benefit", x_min, x_max, 0.6, 0.7)[0].size == 0
+    # A viewport overlapping an edge only shows the cells inside the slice
+    values, (x_min, x_max, _, _) = pyramid.viewport("benefit", 0.9, 1.3, 0.6, 0.7)
+    assert x_max == 1 and values.shape[1] == 2
+
+
+def test_numpy_fixed_parameter(tmp_path):
+    build_tile_pyramid(
+        str(tmp_path),
+        ("source_evaluative_capacity", 0, 1),
+        ("competence", 0.5, 1),
+        fixed_parameters={"degree_open_mindedness": np.arange(5)[4]},
+        number_of_levels=1,
+        tile_size=4,
+    )
+    pyramid = TilePyramid(str(tmp_path))
+    assert pyramid.index["fixed_parameters"] == {"degree_open_mindedness": 4}
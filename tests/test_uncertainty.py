@@ -0,0 +1,70 @@
+import numpy as np
+from accuracy_calculator import Agent
+from scipy.integrate import quad
+from scipy.stats import beta
+from uncertainty import BetaPrior, expected_benefit_open_mind
+
+
+def test_beta_prior_quadrature():
+    def benefit(source_evaluative_capacity):
+        return Agent(
+            degree_open_mindedness=4,
+            source_evaluative_capacity=source_evaluative_capacity,
+        ).benefit_open_mind()
+
+    for a, b in [(1, 1), (3, 2), (0.5, 4)]:
+        expected_benefit, variance = expected_benefit_open_mind(
+            {"source_evaluative_capacity": BetaPrior(a, b)}, degree_open_mindedness=4
+        )
+        first_moment = quad(lambda s: benefit(s) * beta.pdf(s, a, b), 0, 1)[0]
+        second_moment = quad(lambda s: benefit(s) ** 2 * beta.pdf(s, a, b), 0, 1)[0]
+        assert np.isclose(expected_benefit, first_moment)
+        assert np.isclose(variance, second_moment - first_moment**2)
+
+
+def test_prior_per_grid_cell():
+    means = np.array([0.3, 0.6, 0.9])
+    competences = np.array([0.6, 0.7, 0.8, 0.9])[:, None]
+    expected_benefit, variance = expected_benefit_open_mind(
+        {"source_evaluative_capacity": BetaPrior.from_mean(means, 20)},
+        degree_open_mindedness=2,
+        competence_reliable_group=competences,
+        competence_unreliable_group=competences,
+    )
+    assert expected_benefit.shape == (4, 3)
+    for row, competence in enumerate(competences[:, 0]):
+        for column, mean in enumerate(means):
+            cell, cell_variance = expected_benefit_open_mind(
+                {"source_evaluative_capacity": BetaPrior.from_mean(mean, 20)},
+                degree_open_mindedness=2,
+                competence_reliable_group=competence,
+                competence_unreliable_group=competence,
+            )
+            assert np.isclose(expected_benefit[row, column], cell)
+            assert np.isclose(variance[row, column], cell_variance)
+
+
+def test_empirical_samples():
+    rng = np.random.default_rng(0)
+    source_evaluative_capacities = rng.uniform(0.4, 1.0, 2500)
+    competences = rng.uniform(0.55, 0.9, 2500)
+    expected_benefit, variance = expected_benefit_open_mind(
+        {
+            "source_evaluative_capacity": source_evaluative_capacities,
+            "competence_reliable_group": competences,
+        },
+        batch_size=1000,
+        degree_open_mindedness=3,
+    )
+    benefits = [
+        Agent(
+            degree_open_mindedness=3,
+            competence_reliable_group=competence,
+            source_evaluative_capacity=source_evaluative_capacity,
+        ).benefit_open_mind()
+        for competence, source_evaluative_capacity in zip(
+            competences, source_evaluative_capacities
+        )
+    ]
+    assert np.isclose(expected_benefit, np.mean(benefits))
+    assert np.isclose(variance, np.var(benefits))
@@ -0,0 +1,305 @@
+import numpy as np
+
+from accuracy_calculator import (
+    accuracy_information_array,
+    accuracy_open_mind_array,
+    trustee_accuracy_array,
+)
+
+NUMBER_OF_BISECTIONS = 60
+QUANTITIES = ("tipping_content", "tipping_source", "minimum_degree")
+
+
+def information_accuracy_threshold(
+    degree_open_mindedness, competence_reliable_group
+) -> np.ndarray:
+    """Returns the accuracy of the accepted information above which open-mindedness
+    is epistemically beneficial, for every (broadcast) degree of open-mindedness and
+    competence of the reliable group.
+
+    The accuracy of an open-minded agent increases with the accuracy of the
+    information, so the threshold is found by vectorized bisection. It does not
+    depend on the other parameters, which enter only through the accuracy of the
+    information; all other thresholds follow from it in closed form. An infinite
+    degree gives the limit 1/2 of large degrees. It is NaN where open-mindedness can
+    never be beneficial (degree 0, or a competence of 1).
+
+    Returns
+    -------
+    threshold: np.ndarray
+        Threshold on the accuracy of the information"""
+    degree_open_mindedness = np.asarray(degree_open_mindedness)
+    competence_reliable_group = np.asarray(competence_reliable_group, dtype=float)
+    is_infinite = np.isinf(degree_open_mindedness)
+    finite_degree = np.where(is_infinite, 1, degree_open_mindedness).astype(int)
+    shape = np.broadcast_shapes(finite_degree.shape, competence_reliable_group.shape)
+    lower = np.zeros(shape)
+    upper = np.ones(shape)
+    for _ in range(NUMBER_OF_BISECTIONS):
+        middle = (lower + upper) / 2
+        # With source evaluative capacity 0 and content evaluative capacity 0.5,
+        # the accuracy of the information is 1 - competence_unreliable_group
+        is_beneficial = (
+            accuracy_open_mind_array(
+                degree_open_mindedness=finite_degree,
+                competence_unreliable_group=1 - middle,
+                competence_reliable_group=competence_reliable_group,
+                source_evaluative_capacity=0,
+                content_evaluative_capacity=0.5,
+            )
+            > competence_reliable_group
+        )
+        lower = np.where(is_beneficial, lower, middle)
+        upper = np.where(is_beneficial, middle, upper)
+    threshold = np.where(is_infinite, 0.5, upper)
+    return np.where(
+        (finite_degree == 0) | (competence_reliable_group >= 1) | (upper == 1),
+        np.nan,
+        threshold,
+    )
+
+
+def tipping_content_evaluative_capacity_array(
+    degree_open_mindedness=10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    threshold=None,
+) -> np.ndarray:
+    """Vectorized counterpart of `find_tipping_evaluation_content`: returns the
+    content evaluative capacity above which open-mindedness is epistemically
+    beneficial, without rounding it to a grid of step 0.01. It is NaN where no
+    content evaluative capacity makes open-mindedness beneficial.
+
+    The optional `threshold` is the precomputed `information_accuracy_threshold` for
+    these parameters.
+
+    Returns
+    -------
+    tipping_point: np.ndarray
+        Tipping point for every (broadcast) parameter setting"""
+    if threshold is None:
+        threshold = information_accuracy_threshold(
+            degree_open_mindedness, competence_reliable_group
+        )
+    trustee_accuracy = trustee_accuracy_array(
+        competence_unreliable_group,
+        competence_reliable_group,
+        source_evaluative_capacity,
+    )
+    # Solve p_I(p_EC) = threshold, where p_I = p_T p_EC / (p_T p_EC + (1 - p_T)
+    # (1 - p_EC))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tipping_point = (threshold * (1 - trustee_accuracy)) / (
+            threshold * (1 - trustee_accuracy) + trustee_accuracy * (1 - threshold)
+        )
+    return np.where((trustee_accuracy > 0) & (tipping_point < 1), tipping_point, np.nan)
+
+
+def tipping_source_evaluative_capacity_array(
+    degree_open_mindedness=10,
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    content_evaluative_capacity=0.5,
+    threshold=None,
+) -> np.ndarray:
+    """Returns the minimum source evaluative capacity above which open-mindedness is
+    epistemically beneficial: 0 where it is beneficial for any source evaluative
+    capacity, and NaN where it is beneficial for none.
+
+    For an infinite degree of open-mindedness and content evaluative capacity 1/2,
+    this is the epistemic potential `calculate_tipping_source`. The optional
+    `threshold` is the precomputed `information_accuracy_threshold` for these
+    parameters.
+
+    Returns
+    -------
+    tipping_point: np.ndarray
+        Tipping point for every (broadcast) parameter setting"""
+    if threshold is None:
+        threshold = information_accuracy_threshold(
+            degree_open_mindedness, competence_reliable_group
+        )
+    content_evaluative_capacity = np.asarray(content_evaluative_capacity, dtype=float)
+    competence_unreliable_group = np.asarray(competence_unreliable_group, dtype=float)
+    # Trustee accuracy for which the information accuracy equals the threshold,
+    # inverting p_I(p_T) for the content evaluative capacity
+    with np.errstate(divide="ignore", invalid="ignore"):
+        required_trustee_accuracy = (threshold * (1 - content_evaluative_capacity)) / (
+            threshold * (1 - content_evaluative_capacity)
+            + (1 - threshold) * content_evaluative_capacity
+        )
+        # The trustee accuracy is linear in the source evaluative capacity, from
+        # 1 - p_U (at 0) to p_R (at 1)
+        slope = competence_reliable_group + competence_unreliable_group - 1
+        tipping_point = (
+            required_trustee_accuracy - (1 - competence_unreliable_group)
+        ) / slope
+        is_beneficial_without_source_evaluation = (
+            1 - competence_unreliable_group > required_trustee_accuracy
+        )
+    return np.where(
+        slope > 0,
+        np.where(tipping_point < 1, np.maximum(tipping_point, 0), np.nan),
+        np.where(is_beneficial_without_source_evaluation, 0, np.nan),
+    )
+
+
+def degree_thresholds(competence_reliable_group, max_degree: int = 100) -> tuple:
+    """Returns the unique competences of the reliable group and, for every degree of
+    open-mindedness from 1 to `max_degree` (rows) and unique competence (columns),
+    the minimum of `information_accuracy_threshold` over the degrees up to it.
+
+    This running minimum decreases with the degree, and open-mindedness is
+    beneficial for some degree up to n exactly when the accuracy of the information
+    is above it. Degrees for which open-mindedness is never beneficial are
+    skipped."""
+    competences = np.unique(competence_reliable_group)
+    thresholds = information_accuracy_threshold(
+        np.arange(1, max_degree + 1)[:, None], competences[None, :]
+    )
+    return competences, np.minimum.accumulate(np.nan_to_num(thresholds, nan=np.inf))
+
+
+def minimum_degree_array(
+    competence_unreliable_group=0.7,
+    competence_reliable_group=0.6,
+    source_evaluative_capacity=0.5,
+    content_evaluative_capacity=0.5,
+    max_degree: int = 100,
+    thresholds: tuple = None,
+) -> np.ndarray:
+    """Returns the minimum degree of open-mindedness (at least 1) for which
+    open-mindedness is epistemically beneficial, and NaN where no degree up to
+    `max_degree` is.
+
+    The minimum degree of every cell is found by a vectorized binary search over the
+    running minimum of the thresholds of `degree_thresholds`, which may be passed
+    precomputed (for at least the competences in `competence_reliable_group`) as
+    `thresholds`.
+
+    Returns
+    -------
+    minimum_degree: np.ndarray
+        Minimum degree for every (broadcast) parameter setting, as floats"""
+    # 0. Thresholds per degree and competence of the reliable group
+    competence_reliable_group = np.asarray(competence_reliable_group, dtype=float)
+    if thresholds is None:
+        thresholds = degree_thresholds(competence_reliable_group, max_degree)
+    competences, running_minimum = thresholds
+    max_degree = running_minimum.shape[0]
+
+    # 1. Binary search for the number of degrees below the minimum degree, that is,
+    # the number of degrees whose running minimum is at least the accuracy of the
+    # information
+    information_accuracy = accuracy_information_array(
+        trustee_accuracy_array(
+            competence_unreliable_group,
+            competence_reliable_group,
+            source_evaluative_capacity,
+        ),
+        content_evaluative_capacity,
+    )
+    # The table is padded with -inf to a power of two of degrees, such that the
+    # binary search takes steps of halving powers of two without bounds checks, and
+    # flattened (one row per competence) such that it gathers with one flat index
+    size = 2 ** int(np.ceil(np.log2(max_degree + 1)))
+    table = np.full((competences.size, size), -np.inf)
+    table[:, :max_degree] = running_minimum.T
+    table = table.ravel()
+    # Flat index of the last degree known not to be beneficial
+    column_start = np.searchsorted(competences, competence_reliable_group) * size
+    position = np.broadcast_to(column_start - 1, information_accuracy.shape).copy()
+    step = size // 2
+    while step:
+        # NaN accuracies are never above the threshold
+        position += step * ~(information_accuracy > table[position + step])
+        step //= 2
+    number_not_beneficial = position + 1 - column_start
+    return np.where(
+        number_not_beneficial < max_degree, number_not_beneficial + 1.0, np.nan
+    )
+
+
+def threshold_volume(
+    quantity: str,
+    axes: dict,
+    fixed_parameters: dict = None,
+    filename: str = None,
+    dtype: str = "float32",
+) -> np.ndarray:
+    """Computes a threshold on the dense grid spanned by `axes`, one slab along the
+    first axis at a time, so that grids of a billion cells fit in memory (or are
+    written to disk when `filename` is given).
+
+    The thresholds on the accuracy of the information only depend on the degree of
+    open-mindedness and the competence of the reliable group, so they are computed
+    once for the whole grid; all other work is closed-form and elementwise (or a
+    short binary search for the minimum degree).
+
+    Parameters
+    ----------
+    quantity: str
+        'tipping_content', 'tipping_source' or 'minimum_degree'
+    axes: dict
+        Maps the names of the parameters of the threshold function to the 1-d array
+        of values of that axis; the grid is the cartesian product of the axes
+    fixed_parameters: dict
+        Values of the other parameters
+    filename: str
+        Location of a .npy file to which the grid is written as it is computed, and
+        which is returned memory-mapped (optional)
+    dtype: str
+        Data type of the grid
+
+    Returns
+    -------
+    volume: np.ndarray
+        Threshold for every cell of the grid, NaN where it is unreachable"""
+    # 0. Initialize variables
+    if quantity not in QUANTITIES:
+        raise ValueError(f"Quantity must be one of {QUANTITIES}")
+    function = {
+        "tipping_content": tipping_content_evaluative_capacity_array,
+        "tipping_source": tipping_source_evaluative_capacity_array,
+        "minimum_degree": minimum_degree_array,
+    }[quantity]
+    parameters = dict(fixed_parameters or {})
+    for dimension, (name, values) in enumerate(axes.items()):
+        shape = [1] * len(axes)
+        shape[dimension] = -1
+        parameters[name] = np.reshape(values, shape)
+    shape = tuple(len(values) for values in axes.values())
+    if filename:
+        volume = np.lib.format.open_memmap(
+            filename, mode="w+", dtype=dtype, shape=shape
+        )
+    else:
+        volume = np.empty(shape, dtype=dtype)
+    if quantity == "minimum_degree":
+        parameters["thresholds"] = degree_thresholds(
+            parameters.get("competence_reliable_group", 0.6),
+            parameters.pop("max_degree", 100),
+        )
+    else:
+        parameters["threshold"] = information_accuracy_threshold(
+            parameters.get("degree_open_mindedness", 10),
+            parameters.get("competence_reliable_group", 0.6),
+        )
+
+    # 1. Compute the grid slab by slab
+    for index in range(shape[0]):
+        slab_parameters = {
+            name: (
+                value[index : index + 1]
+                if isinstance(value, np.ndarray)
+                and value.ndim == len(shape)
+                and value.shape[0] > 1
+                else value
+            )
+            for name, value in parameters.items()
+        }
+        volume[index] = np.broadcast_to(function(**slab_parameters), (1, *shape[1:]))[0]
+    if filename:
+        volume.flush()
+    return volume
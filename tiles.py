@@ -0,0 +1,275 @@
+import json
+import os
+
+import numpy as np
+
+from accuracy_calculator import benefit_open_mind_array
+from sweep import AGENT_PARAMETERS, DEFAULT_PARAMETERS, code_hash
+from thresholds import tipping_content_evaluative_capacity_array
+
+QUANTITIES = ("benefit", "tipping")
+INDEX_FILENAME = "index.json"
+
+
+def resolve_parameters(parameters: dict) -> dict:
+    """Returns the parameters of `Agent` for a slice that may use the parameters of
+    the figures: 'competence' sets the competence of the reliable group and, minus
+    'advantage' (0 by default), the competence of the unreliable group."""
+    parameters = dict(parameters)
+    advantage = parameters.pop("advantage", 0)
+    if "competence" in parameters:
+        competence = parameters.pop("competence")
+        parameters["competence_reliable_group"] = competence
+        parameters["competence_unreliable_group"] = competence - advantage
+    unknown = set(parameters) - set(AGENT_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+    return {**DEFAULT_PARAMETERS, **parameters}
+
+
+def cell_centers(axis: dict, number_of_cells: int) -> np.ndarray:
+    """Returns the values of the parameter of `axis` at the centers of the cells
+    when its range is divided into `number_of_cells` cells."""
+    cell_width = (axis["stop"] - axis["start"]) / number_of_cells
+    values = axis["start"] + (np.arange(number_of_cells) + 0.5) * cell_width
+    if axis["name"] == "degree_open_mindedness":
+        values = np.round(values).astype(int)
+    return values
+
+
+def tile_filename(folder_name: str, quantity: str, level: int) -> str:
+    return os.path.join(folder_name, f"{quantity}_{level}.bin")
+
+
+def compute_quantity(quantity: str, parameters: dict) -> np.ndarray:
+    if quantity == "benefit":
+        return benefit_open_mind_array(**parameters)
+    parameters = dict(parameters)
+    parameters.pop("content_evaluative_capacity")
+    return tipping_content_evaluative_capacity_array(**parameters)
+
+
+def build_tile_pyramid(
+    folder_name: str,
+    x_axis: tuple,
+    y_axis: tuple,
+    fixed_parameters: dict = None,
+    quantities: tuple = QUANTITIES,
+    number_of_levels: int = 4,
+    tile_size: int = 256,
+    dtype: str = "float16",
+) -> dict:
+    """Precomputes the epistemic benefit of open-mindedness and the tipping point for
+    content evaluative capacity on a 2-d slice of the parameter space, at several
+    resolutions, for interactive exploration.
+
+    Level 0 is a single tile covering the whole slice; every next level doubles the
+    resolution along both axes. Every cell holds the value at its center (computed
+    exactly, not averaged from a finer level). The tiles of one quantity and level
+    are stored back to back in one binary file, so that reading a tile is a single
+    contiguous read; `index.json` describes the slice and the layout.
+
+    Parameters
+    ----------
+    folder_name: str
+        Folder where the tiles and the index are written
+    x_axis, y_axis: tuple
+        Tuples (name, start, stop) of the parameters along the columns and rows. The
+        names are parameters of `Agent`, or 'competence' for the competence of both
+        groups as in `figure_heatmap_source` and `figure_heatmap_content_only`
+    fixed_parameters: dict
+        Values of the other parameters (and 'advantage' when 'competence' is used);
+        defaults as in `Agent`
+    quantities: tuple
+        Quantities to precompute: 'benefit' and/or 'tipping'
+    number_of_levels: int
+        Number of resolution levels
+    tile_size: int
+        Number of cells along each side of a tile
+    dtype: str
+        Data type in which the values are stored
+
+    Returns
+    -------
+    index: dict
+        Description of the pyramid, as written to `index.json`"""
+    # 0. Initialize variables
+    fixed_parameters = fixed_parameters or {}
+    axes = [
+        {"name": name, "start": float(start), "stop": float(stop)}
+        for name, start, stop in (x_axis, y_axis)
+    ]
+    if axes[0]["name"] == axes[1]["name"]:
+        raise ValueError("The two axes must have different parameters")
+    if "tipping" in quantities and "content_evaluative_capacity" in {
+        axis["name"] for axis in axes
+    }:
+        raise ValueError("The tipping point requires a slice without content axis")
+    unknown = set(quantities) - set(QUANTITIES)
+    if unknown:
+        raise ValueError(f"Unknown quantities: {sorted(unknown)}")
+    # The index is serialized before any tile is computed, so that it cannot fail
+    # after the tiles are written; numpy scalars are written as Python numbers
+    index = json.loads(
+        json.dumps(
+            {
+                "x_axis": axes[0],
+                "y_axis": axes[1],
+                "fixed_parameters": fixed_parameters,
+                "quantities": list(quantities),
+                "number_of_levels": number_of_levels,
+                "tile_size": tile_size,
+                "dtype": dtype,
+                "code_hash": code_hash(),
+            },
+            default=lambda value: value.item(),
+        )
+    )
+    os.makedirs(folder_name, exist_ok=True)
+
+    # 1. Compute every level, one row of tiles at a time
+    for level in range(number_of_levels):
+        tiles_per_side = 2**level
+        number_of_cells = tile_size * tiles_per_side
+        x_values = cell_centers(axes[0], number_of_cells)
+        y_values = cell_centers(axes[1], number_of_cells)
+        files = {
+            quantity: np.memmap(
+                tile_filename(folder_name, quantity, level),
+                dtype=dtype,
+                mode="w+",
+                shape=(tiles_per_side, tiles_per_side, tile_size, tile_size),
+            )
+            for quantity in quantities
+        }
+        for row in range(tiles_per_side):
+            parameters = resolve_parameters(
+                {
+                    **fixed_parameters,
+                    axes[0]["name"]: x_values[None, :],
+                    axes[1]["name"]: y_values[
+                        row * tile_size : (row + 1) * tile_size, None
+                    ],
+                }
+            )
+            for quantity, file in files.items():
+                values = np.broadcast_to(
+                    compute_quantity(quantity, parameters),
+                    (tile_size, number_of_cells),
+                )
+                # Split the row of cells into its tiles
+                file[row] = values.reshape(
+                    tile_size, tiles_per_side, tile_size
+                ).transpose(1, 0, 2)
+        for file in files.values():
+            file.flush()
+
+    # 2. Write the index
+    with open(os.path.join(folder_name, INDEX_FILENAME), "w") as file:
+        json.dump(index, file, indent=2)
+    return index
+
+
+class TilePyramid:
+    def __init__(self, folder_name: str):
+        """Reader of a pyramid written by `build_tile_pyramid`. The tile files are
+        memory-mapped, so that only the tiles in view are read from disk."""
+        self.folder_name = folder_name
+        with open(os.path.join(folder_name, INDEX_FILENAME)) as file:
+            self.index = json.load(file)
+        self.x_axis = self.index["x_axis"]
+        self.y_axis = self.index["y_axis"]
+        self.tile_size = self.index["tile_size"]
+        self.number_of_levels = self.index["number_of_levels"]
+        self.files = {}
+
+    def level_for_resolution(self, x_min, x_max, y_min, y_max, resolution) -> int:
+        """Returns the coarsest level with at least `resolution` cells along each
+        side of the viewport, or the finest level if there is none."""
+        fraction = min(
+            (x_max - x_min) / (self.x_axis["stop"] - self.x_axis["start"]),
+            (y_max - y_min) / (self.y_axis["stop"] - self.y_axis["start"]),
+        )
+        for level in range(self.number_of_levels):
+            if fraction * self.tile_size * 2**level >= resolution:
+                return level
+        return self.number_of_levels - 1
+
+    def cell_range(self, axis: dict, minimum, maximum, level: int) -> tuple:
+        # Half-open range of the cells of `level` that overlap [minimum, maximum],
+        # which is empty when the range lies outside of the slice
+        number_of_cells = self.tile_size * 2**level
+        cell_width = (axis["stop"] - axis["start"]) / number_of_cells
+        first = int(np.floor((minimum - axis["start"]) / cell_width))
+        last = max(int(np.ceil((maximum - axis["start"]) / cell_width)), first + 1)
+        return (
+            min(max(first, 0), number_of_cells),
+            min(max(last, 0), number_of_cells),
+        )
+
+    def tiles_in_viewport(
+        self, x_min, x_max, y_min, y_max, resolution: int = 512
+    ) -> tuple:
+        """Returns the level for the viewport [x_min, x_max] x [y_min, y_max] shown
+        with `resolution` cells along each side, and the list of (row, column) of
+        the tiles of that level that are needed."""
+        level = self.level_for_resolution(x_min, x_max, y_min, y_max, resolution)
+        columns = self.cell_range(self.x_axis, x_min, x_max, level)
+        rows = self.cell_range(self.y_axis, y_min, y_max, level)
+        return level, [
+            (row, column)
+            for row in range(rows[0] // self.tile_size, -(-rows[1] // self.tile_size))
+            for column in range(
+                columns[0] // self.tile_size, -(-columns[1] // self.tile_size)
+            )
+        ]
+
+    def tile(self, quantity: str, level: int, row: int, column: int) -> np.ndarray:
+        """Returns one tile; rows correspond to increasing values of the y axis and
+        columns to increasing values of the x axis."""
+        if (quantity, level) not in self.files:
+            tiles_per_side = 2**level
+            self.files[quantity, level] = np.memmap(
+                tile_filename(self.folder_name, quantity, level),
+                dtype=self.index["dtype"],
+                mode="r",
+                shape=(tiles_per_side, tiles_per_side, self.tile_size, self.tile_size),
+            )
+        return self.files[quantity, level][row, column]
+
+    def viewport(
+        self, quantity: str, x_min, x_max, y_min, y_max, resolution: int = 512
+    ) -> tuple:
+        """Assembles the values of `quantity` in the viewport from the needed tiles.
+
+        Returns
+        -------
+        (values, extent): tuple
+            2-d array of the cells overlapping the viewport (rows along the y axis;
+            empty when the viewport lies outside of the slice) and the extent
+            (x_min, x_max, y_min, y_max) covered by these cells"""
+        level, tiles = self.tiles_in_viewport(x_min, x_max, y_min, y_max, resolution)
+        columns = self.cell_range(self.x_axis, x_min, x_max, level)
+        rows = self.cell_range(self.y_axis, y_min, y_max, level)
+        values = np.empty(
+            (rows[1] - rows[0], columns[1] - columns[0]), dtype=self.index["dtype"]
+        )
+        for row, column in tiles:
+            tile = self.tile(quantity, level, row, column)
+            # Position of the tile relative to the viewport
+            top = row * self.tile_size - rows[0]
+            left = column * self.tile_size - columns[0]
+            values[
+                max(top, 0) : top + self.tile_size, max(left, 0) : left + self.tile_size
+            ] = tile[max(-top, 0) :, max(-left, 0) :][
+                : values.shape[0] - max(top, 0), : values.shape[1] - max(left, 0)
+            ]
+        number_of_cells = self.tile_size * 2**level
+
+        def edges(axis, cells):
+            cell_width = (axis["stop"] - axis["start"]) / number_of_cells
+            return axis["start"] + cells[0] * cell_width, axis["start"] + (
+                cells[1] * cell_width
+            )
+
+        return values, (*edges(self.x_axis, columns), *edges(self.y_axis, rows))
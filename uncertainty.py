@@ -0,0 +1,144 @@
+import functools
+
+import numpy as np
+from scipy.special import roots_jacobi
+
+from accuracy_calculator import benefit_open_mind_array
+
+
+class BetaPrior:
+    def __init__(self, a, b, low=0.0, high=1.0):
+        """Beta(a, b) distribution of a parameter, rescaled from [0, 1] to
+        [low, high]. All arguments may be arrays, in which case they are broadcast
+        against the grid of the other parameters (one prior per grid cell)."""
+        self.a = np.asarray(a, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+
+    @classmethod
+    def from_mean(cls, mean, concentration, low=0.0, high=1.0):
+        """Beta prior with the given mean (on [low, high]) and concentration a + b."""
+        mean = (np.asarray(mean, dtype=float) - low) / (high - low)
+        return cls(mean * concentration, (1 - mean) * concentration, low, high)
+
+    def shape(self) -> tuple:
+        return np.broadcast_shapes(
+            self.a.shape, self.b.shape, self.low.shape, self.high.shape
+        )
+
+    def quadrature(self, order: int) -> tuple:
+        """Returns the Gauss-Jacobi nodes and weights of this prior, with shape
+        `self.shape() + (order,)`. Nodes are only computed once for every distinct
+        (a, b), however many grid cells share that prior shape."""
+        shape = self.shape()
+        a = np.broadcast_to(self.a, shape).reshape(-1)
+        b = np.broadcast_to(self.b, shape).reshape(-1)
+        shapes, inverse = np.unique(
+            np.stack([a, b], axis=1), axis=0, return_inverse=True
+        )
+        unique_nodes, unique_weights = zip(
+            *(gauss_jacobi_beta(float(a), float(b), order) for a, b in shapes)
+        )
+        nodes = np.array(unique_nodes)[inverse.reshape(-1)].reshape(shape + (order,))
+        weights = np.array(unique_weights)[inverse.reshape(-1)].reshape(
+            shape + (order,)
+        )
+        low = self.low[..., None]
+        high = self.high[..., None]
+        return low + (high - low) * nodes, weights
+
+
+@functools.lru_cache(maxsize=None)
+def gauss_jacobi_beta(a: float, b: float, order: int) -> tuple:
+    """Returns Gauss-Jacobi nodes on [0, 1] and weights (summing to 1) for the
+    Beta(a, b) distribution. The rule is exact for polynomials up to degree
+    2 * order - 1."""
+    if a <= 0 or b <= 0:
+        raise ValueError(f"Beta parameters must be positive, got ({a}, {b})")
+    # The Jacobi weight (1 - x)^alpha (1 + x)^beta on [-1, 1] is the Beta(beta + 1,
+    # alpha + 1) density after substituting x = 2t - 1
+    nodes, weights = roots_jacobi(order, b - 1, a - 1)
+    nodes = (1 + nodes) / 2
+    weights = weights / weights.sum()
+    nodes.flags.writeable = False
+    weights.flags.writeable = False
+    return nodes, weights
+
+
+def expected_benefit_open_mind(
+    priors: dict, order: int = 32, batch_size: int = 1024, **parameters
+) -> tuple:
+    """Computes the expectation and variance of the epistemic benefit of
+    open-mindedness when some parameters of `Agent` are uncertain.
+
+    Parameters
+    ----------
+    priors: dict
+        Maps names of `Agent` parameters to their distribution: either a `BetaPrior`
+        (integrated with Gauss-Jacobi quadrature) or a 1-d array of empirical samples.
+        Parameters with empirical samples are sampled jointly, so they must all have
+        the same number of samples. Beta-distributed parameters are independent.
+    order: int
+        Number of quadrature nodes per Beta-distributed parameter
+    batch_size: int
+        Number of empirical samples that are evaluated at once
+    parameters:
+        Values of the other `Agent` parameters (scalars or arrays, broadcast against
+        each other and against the priors)
+
+    Returns
+    -------
+    (expected_benefit, variance): tuple
+        Arrays with the broadcast shape of `parameters` and the priors"""
+    # 0. Initialize variables
+    beta_priors = {
+        name: prior for name, prior in priors.items() if isinstance(prior, BetaPrior)
+    }
+    samples = {
+        name: np.asarray(prior, dtype=float).reshape(-1)
+        for name, prior in priors.items()
+        if name not in beta_priors
+    }
+    number_of_samples = {len(values) for values in samples.values()}
+    if len(number_of_samples) > 1:
+        raise ValueError("Empirical samples must all have the same length")
+    number_of_samples = number_of_samples.pop() if samples else 1
+    grid_shape = np.broadcast_shapes(
+        *(np.shape(value) for value in parameters.values()),
+        *(prior.shape() for prior in beta_priors.values()),
+    )
+    grid_dimension = len(grid_shape)
+
+    # 1. Each Beta prior gets its own quadrature axis after the grid axes, and the
+    # empirical samples share the last axis
+    number_of_axes = len(beta_priors) + 1
+    weights = np.ones(grid_shape + (1,) * number_of_axes)
+    for axis, (name, prior) in enumerate(beta_priors.items()):
+        prior_nodes, prior_weights = prior.quadrature(order)
+        index = (Ellipsis,) + (None,) * axis + (slice(None),)
+        index += (None,) * (number_of_axes - axis - 1)
+        parameters[name] = prior_nodes[index]
+        weights = weights * prior_weights[index]
+    parameters = {
+        name: (
+            np.reshape(value, np.shape(value) + (1,) * number_of_axes)
+            if name not in beta_priors
+            else value
+        )
+        for name, value in parameters.items()
+    }
+
+    # 2. Accumulate the first two moments batch by batch
+    first_moment = np.zeros(grid_shape)
+    second_moment = np.zeros(grid_shape)
+    summed_axes = tuple(range(grid_dimension, grid_dimension + number_of_axes))
+    for start in range(0, number_of_samples, batch_size):
+        for name, values in samples.items():
+            parameters[name] = values[start : start + batch_size]
+        benefits = benefit_open_mind_array(**parameters)
+        weighted_benefits = weights * benefits / number_of_samples
+        first_moment += weighted_benefits.sum(axis=summed_axes)
+        second_moment += (weighted_benefits * benefits).sum(axis=summed_axes)
+    variance = np.maximum(second_moment - first_moment**2, 0)
+    return first_moment, variance